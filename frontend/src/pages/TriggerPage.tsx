@@ -7,9 +7,14 @@
  * URL: /trigger?guid=X&token_id=Y&secret=Z
  * 
  * Polling rules:
- * - Single interval owner (intervalRef)
+ * - Single timer owner (timerRef); the next poll is scheduled after each
+ *   response, honouring the server's poll_after_ms hint
+ * - 5xx/network failures retry with full-jitter exponential backoff
  * - Stops permanently on terminal states (ready, failed, error)
- * - HTTP-driven: 200=valid, 4xx=permanent error, 5xx=temporary
+ * - Paused while the tab is hidden (in-flight request aborted); resumes
+ *   with an immediate poll when it is shown again
+ * - HTTP-driven: 200=valid, 429=retry after Retry-After, other 4xx=permanent
+ *   error, 5xx=temporary
  * - "Temporary error" only for 5xx/network failures
  */
 
@@ -18,7 +23,11 @@ import { useSearchParams } from 'react-router-dom';
 import ProcessingProgressUI from '../components/ProcessingProgressUI';
 
 const TERMINAL_STATES = ['ready', 'completed', 'failed', 'error'];
-const POLL_INTERVAL_MS = 2000;
+const DEFAULT_POLL_INTERVAL_MS = 2000;
+const MIN_POLL_INTERVAL_MS = 500;
+const POLL_JITTER_MS = 250;
+const BASE_RETRY_MS = 1000;
+const MAX_RETRY_MS = 30000;
 
 interface ErrorDetails {
   friendly: string;
@@ -32,6 +41,7 @@ interface TriggerStatus {
   download_url: string | null;
   message: string;
   error_details?: ErrorDetails;
+  poll_after_ms?: number;
   job: {
     id: string;
     status: string;
@@ -56,40 +66,72 @@ export default function TriggerPage() {
   const [copiedFeedUrl, setCopiedFeedUrl] = useState(false);
   const [showTechnicalDetails, setShowTechnicalDetails] = useState(false);
 
-  // Single polling owner - only one interval ever exists
-  const intervalRef = useRef<number | null>(null);
+  // Single polling owner - only one pending timer ever exists
+  const timerRef = useRef<number | null>(null);
   const stoppedRef = useRef(false);
+  const failuresRef = useRef(0);
+  const inflightRef = useRef<AbortController | null>(null);
+
+  // Full-jitter backoff so open tabs don't retry in lockstep after an outage
+  const retryDelay = () => {
+    failuresRef.current += 1;
+    return Math.random() * Math.min(MAX_RETRY_MS, BASE_RETRY_MS * 2 ** failuresRef.current);
+  };
+
+  // Cancel the pending timer and any in-flight request
+  const pausePolling = () => {
+    if (timerRef.current !== null) {
+      window.clearTimeout(timerRef.current);
+      timerRef.current = null;
+    }
+    inflightRef.current?.abort();
+  };
 
   // Stop polling permanently
   const stopPolling = () => {
     stoppedRef.current = true;
-    if (intervalRef.current !== null) {
-      window.clearInterval(intervalRef.current);
-      intervalRef.current = null;
-    }
+    pausePolling();
+  };
+
+  // Schedule the next poll unless polling has stopped or the tab is hidden;
+  // the visibilitychange handler resumes a hidden tab
+  const scheduleNextPoll = (delayMs: number) => {
+    if (stoppedRef.current || document.hidden) return;
+    timerRef.current = window.setTimeout(pollOnce, delayMs);
+  };
+
+  // Fetch once, then schedule the next fetch using the server's pacing hint
+  const pollOnce = async () => {
+    timerRef.current = null;
+    const pollAfterMs = await fetchStatus();
+    scheduleNextPoll(pollAfterMs ?? DEFAULT_POLL_INTERVAL_MS);
   };
 
   // Build status URL
   const buildStatusUrl = () => {
     if (!guid || !tokenId || !secret) return null;
-    return `/api/trigger/status?guid=${encodeURIComponent(guid)}&feed_token=${encodeURIComponent(tokenId)}&feed_secret=${encodeURIComponent(secret)}&t=${Date.now()}`;
+    return `/api/trigger/status?guid=${encodeURIComponent(guid)}&feed_token=${encodeURIComponent(tokenId)}&feed_secret=${encodeURIComponent(secret)}`;
   };
 
-  // Fetch status - HTTP-driven logic
-  const fetchStatus = async () => {
-    if (stoppedRef.current) return;
+  // Fetch status - HTTP-driven logic. Returns the delay before the next poll:
+  // the server's hint (plus jitter) on success, a backoff delay on failure.
+  const fetchStatus = async (): Promise<number | undefined> => {
+    if (stoppedRef.current) return undefined;
 
     const url = buildStatusUrl();
-    if (!url) return;
+    if (!url) return undefined;
 
+    const controller = new AbortController();
+    inflightRef.current = controller;
     try {
       const response = await fetch(url, {
         method: 'GET',
-        cache: 'no-store',
+        signal: controller.signal,
+        // Revalidate against the server's ETag; unchanged polls are a 304
+        cache: 'no-cache',
         credentials: 'omit',
         headers: {
           Accept: 'application/json',
-          'Cache-Control': 'no-store',
         },
       });
 
@@ -104,7 +146,7 @@ export default function TriggerPage() {
           setErrorDetails(data?.error_details || null);
           setIsTemporarilyUnavailable(false);
           stopPolling();
-          return;
+          return undefined;
         }
 
         // Handle error state
@@ -113,7 +155,7 @@ export default function TriggerPage() {
           setErrorDetails(null);
           setIsTemporarilyUnavailable(false);
           stopPolling();
-          return;
+          return undefined;
         }
 
         // Valid status - update UI
@@ -126,25 +168,42 @@ export default function TriggerPage() {
         if (TERMINAL_STATES.includes(data.state)) {
           stopPolling();
         }
-        return;
+        failuresRef.current = 0;
+        const pollAfterMs =
+          typeof data.poll_after_ms === 'number' ? data.poll_after_ms : DEFAULT_POLL_INTERVAL_MS;
+        return Math.max(MIN_POLL_INTERVAL_MS, pollAfterMs) + Math.random() * POLL_JITTER_MS;
       }
 
       // 5xx: temporary server error - show banner, keep polling
       if (response.status >= 500) {
         setIsTemporarilyUnavailable(true);
         console.warn('[TriggerPage] 5xx response, retrying...', response.status, data?.message);
-        return;
+        return retryDelay();
       }
 
-      // 4xx: permanent error - stop polling
+      // 429: rate limited - wait as long as the server asks, keep polling
+      if (response.status === 429) {
+        const retryAfterSeconds = Number(response.headers.get('Retry-After'));
+        return retryAfterSeconds > 0
+          ? retryAfterSeconds * 1000 + Math.random() * POLL_JITTER_MS
+          : retryDelay();
+      }
+
+      // Other 4xx: permanent error - stop polling
       setError(data?.message || `Error: ${response.status}`);
       setIsTemporarilyUnavailable(false);
       stopPolling();
     } catch (err) {
+      // Aborted because the tab was hidden or the page unmounted
+      if (controller.signal.aborted) return undefined;
       // Network error - temporary, keep polling
       console.error('[TriggerPage] Network error:', err);
       setIsTemporarilyUnavailable(true);
+      return retryDelay();
+    } finally {
+      if (inflightRef.current === controller) inflightRef.current = null;
     }
+    return undefined;
   };
 
   // Single effect for polling lifecycle
@@ -157,14 +216,22 @@ export default function TriggerPage() {
     // Reset state for fresh mount
     stoppedRef.current = false;
 
-    // Initial fetch
-    fetchStatus();
+    // Initial fetch; each response schedules the next one
+    pollOnce();
 
-    // Start single polling interval
-    intervalRef.current = window.setInterval(fetchStatus, POLL_INTERVAL_MS);
+    // No polling while the tab is hidden; catch up as soon as it is shown
+    const onVisibilityChange = () => {
+      if (document.hidden) {
+        pausePolling();
+      } else if (!stoppedRef.current && timerRef.current === null && !inflightRef.current) {
+        pollOnce();
+      }
+    };
+    document.addEventListener('visibilitychange', onVisibilityChange);
 
     // Cleanup on unmount
     return () => {
+      document.removeEventListener('visibilitychange', onVisibilityChange);
       stopPolling();
     };
     // eslint-disable-next-line react-hooks/exhaustive-deps
@@ -174,6 +174,16 @@ def _create_flask_app() -> Flask:
     # x_for=1: Trust X-Forwarded-For header for client IP
     # This is required when behind a reverse proxy like Caddy over WireGuard
     app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1, x_for=1)  # type: ignore[assignment]
+
+    # Skip per-user download/trigger activity rows (download counts still update)
+    app.config["SKIP_ANALYTICS"] = os.environ.get("PODLY_SKIP_ANALYTICS") == "1"
+    # Let a fronting nginx stream processed audio (see _accel_redirect_response)
+    app.config["USE_X_ACCEL_REDIRECT"] = (
+        os.environ.get("PODLY_USE_X_ACCEL_REDIRECT") == "1"
+    )
+    app.config["X_ACCEL_REDIRECT_PREFIX"] = os.environ.get(
+        "PODLY_X_ACCEL_REDIRECT_PREFIX", "/internal-audio/"
+    )
     
     return app
 
@@ -272,7 +282,7 @@ def _configure_trigger_cookie_stripping(app: Flask) -> None:
     @app.after_request
     def _strip_session_cookie_for_trigger(resp):
         path = request.path
-        if path.startswith("/api/trigger/") or path == "/trigger":
+        if path.startswith(("/api/trigger/", "/trigger/")) or path == "/trigger":
             resp.headers.pop("Set-Cookie", None)
             # Strip Vary: Cookie, keep other Vary values if present
             vary = resp.headers.get("Vary", "")
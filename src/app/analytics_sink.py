@@ -0,0 +1,180 @@
+"""Buffered writer for `UserDownload` activity rows and download counters.
+
+Audio downloads and trigger-page events each produce an audit row, and every
+served download bumps `Post.download_count`. Writing those with a commit per
+request puts a synchronous fsync on the hot path, so request handlers enqueue
+them here and a daemon thread writes them in batches, counters and rows
+together in one transaction per batch.
+
+Buffered writes are at-most-once: anything still queued when the process is
+killed (rather than exiting normally) is lost.
+"""
+
+import atexit
+import logging
+import queue
+from collections import Counter
+from datetime import datetime
+from threading import Lock, Thread
+from typing import Any, Dict, List, Optional, cast
+
+from flask import Flask, current_app
+from sqlalchemy import bindparam, func, insert, update
+
+from app.extensions import db
+from app.models import Post, UserDownload
+
+logger = logging.getLogger("global_logger")
+
+# Batches go through one executemany INSERT, which needs every row to carry
+# the same columns; rows are padded with these before being queued.
+_ROW_DEFAULTS: Dict[str, Any] = {
+    "user_id": None,
+    "post_id": None,
+    "feed_id": None,
+    "file_size_bytes": None,
+    "is_processed": False,
+    "download_source": "web",
+    "event_type": None,
+    "auth_type": None,
+    "decision": None,
+}
+
+
+class UserEventSink:
+    """Bounded queue of `UserDownload` rows and per-post download counts,
+    flushed by a background thread."""
+
+    def __init__(
+        self,
+        app: Flask,
+        *,
+        max_queue_size: int = 10000,
+        max_batch_size: int = 500,
+        flush_interval_seconds: float = 1.0,
+        synchronous: bool = False,
+    ) -> None:
+        self._app = app
+        self._synchronous = synchronous
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue_size)
+        self._max_batch_size = max_batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._write_lock = Lock()
+        self._counts_lock = Lock()
+        self._pending_counts: Counter[int] = Counter()
+        if not synchronous:
+            Thread(target=self._run, name="user-event-sink", daemon=True).start()
+
+    def put(self, row: Dict[str, Any]) -> None:
+        """Enqueue a row without blocking; drops it if the buffer is full.
+
+        The event time is stamped here so queued rows keep the request time
+        rather than the flush time.
+        """
+        row = {**_ROW_DEFAULTS, "downloaded_at": datetime.utcnow(), **row}
+        if self._synchronous:
+            self._commit([row], {})
+            return
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            logger.warning(
+                "Dropping %s event for post %s: user event buffer full",
+                row.get("event_type"),
+                row.get("post_id"),
+            )
+
+    def count_download(self, post_id: int) -> None:
+        """Add one to the post's download counter on the next flush."""
+        if self._synchronous:
+            self._commit([], {post_id: 1})
+            return
+        with self._counts_lock:
+            self._pending_counts[post_id] += 1
+
+    def flush(self) -> None:
+        """Write everything currently buffered, including any batch the
+        background thread has already taken but not yet committed."""
+        while True:
+            batch = self._drain(block=False)
+            if not self._write(batch):
+                break
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            self._write(self._drain(block=True))
+
+    def _drain(self, *, block: bool) -> List[Dict[str, Any]]:
+        batch: List[Dict[str, Any]] = []
+        try:
+            if block:
+                batch.append(self._queue.get(timeout=self._flush_interval_seconds))
+            while len(batch) < self._max_batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write(self, batch: List[Dict[str, Any]]) -> bool:
+        """Write `batch` and the pending counters; False if there was nothing."""
+        # Counters are taken under the write lock so a concurrent flush waits
+        # for them to be committed instead of seeing an empty counter.
+        with self._write_lock:
+            with self._counts_lock:
+                counts = dict(self._pending_counts)
+                self._pending_counts.clear()
+            if not batch and not counts:
+                return False
+            try:
+                with self._app.app_context():
+                    self._commit(batch, counts)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        return True
+
+    @staticmethod
+    def _commit(batch: List[Dict[str, Any]], counts: Dict[int, int]) -> None:
+        """Apply counter increments and insert rows in a single transaction."""
+        try:
+            if counts:
+                post_table = Post.__table__
+                db.session.execute(
+                    update(post_table)
+                    .where(post_table.c.id == bindparam("post_id"))
+                    .values(
+                        download_count=func.coalesce(post_table.c.download_count, 0)
+                        + bindparam("n")
+                    ),
+                    [{"post_id": post_id, "n": n} for post_id, n in counts.items()],
+                )
+            if batch:
+                db.session.execute(insert(UserDownload), batch)
+            db.session.commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            db.session.rollback()
+            logger.error(
+                "Failed to write %d user events and counts for %d posts: %s",
+                len(batch),
+                len(counts),
+                exc,
+            )
+
+
+_SINK_LOCK = Lock()
+
+
+def get_user_event_sink(app: Optional[Flask] = None) -> UserEventSink:
+    """Return the sink bound to `app` (default: the current app), creating it."""
+    if app is None:
+        app = current_app._get_current_object()  # type: ignore[attr-defined]
+    with _SINK_LOCK:
+        sink = app.extensions.get("user_event_sink")
+        if sink is None:
+            # Test apps typically share one in-memory SQLite connection across
+            # threads, so they write inline instead of from the sink thread.
+            sink = UserEventSink(app, synchronous=app.testing)
+            app.extensions["user_event_sink"] = sink
+            atexit.register(sink.flush)
+    return cast(UserEventSink, sink)
@@ -5,22 +5,32 @@ import hashlib
 import hmac
 import os
 import secrets
+import time
 import uuid
 from dataclasses import dataclass
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from flask import Request
 
-from flask import current_app, has_app_context
+from flask import current_app, g, has_app_context, has_request_context
+from sqlalchemy import event
 
 from app.auth.service import AuthenticatedUser
 from app.extensions import db
-from app.models import Feed, FeedAccessToken, Post, User
+from app.models import Feed, FeedAccessToken, Post, User, UserFeedSubscription
 
 logger = logging.getLogger("global_logger")
 
+_LAST_USED_REFRESH_INTERVAL = timedelta(minutes=5)
+
+# Combined-feed token ids carry this prefix so callers that only accept
+# feed-scoped tokens can reject them without a lookup. Legacy ids are plain
+# uuid hex, which never contains "_", so the prefix cannot collide.
+COMBINED_TOKEN_PREFIX = "c_"
+
 
 @dataclass(slots=True)
 class FeedTokenAuthResult:
@@ -82,6 +92,9 @@ def create_feed_access_token(user: User, feed: Optional[Feed] = None) -> tuple[s
             return existing.token_id, existing_secret
 
     token_id = uuid.uuid4().hex
+    if feed_id is None:
+        # Keep within the 32-char token_id column.
+        token_id = COMBINED_TOKEN_PREFIX + token_id[len(COMBINED_TOKEN_PREFIX) :]
     secret = _derive_token_secret(token_id)
     token = FeedAccessToken(
         token_id=token_id,
@@ -101,6 +114,15 @@ class FeedTokenValue:
     secret: str
 
 
+def is_combined_token_id(token_id: str) -> bool:
+    """True for combined-feed token ids issued with `COMBINED_TOKEN_PREFIX`.
+
+    Older combined tokens predate the prefix and are only recognisable after
+    authentication (``feed_id is None``).
+    """
+    return token_id.startswith(COMBINED_TOKEN_PREFIX)
+
+
 def get_or_create_feed_token(user_id: int, feed_id: int) -> Optional[FeedTokenValue]:
     """Compatibility helper for legacy call sites that expect id/secret attributes."""
     user = User.query.get(user_id)
@@ -118,9 +140,120 @@ def authenticate_feed_token(
     if not token_id:
         return None
 
-    token = FeedAccessToken.query.filter_by(token_id=token_id, revoked=False).first()
-    if token is None:
+    # The auth middleware and the trigger handlers both authenticate the same
+    # token within one request; only do the work once.
+    scope = _auth_scope(path, req)
+    memo_key = (token_id, secret, scope)
+    memo: Optional[dict[tuple[str, str, str], Optional[FeedTokenAuthResult]]] = None
+    if has_request_context():
+        memo = g.setdefault("_feed_token_auth_memo", {})
+        if memo_key in memo:
+            return memo[memo_key]
+
+    cache_key = _auth_cache_key(token_id, secret, scope)
+    hit, result = _cached_auth_result(cache_key)
+    if not hit:
+        result = _authenticate_feed_token(token_id, secret, path, req=req)
+        _store_auth_result(cache_key, result)
+    if memo is not None:
+        memo[memo_key] = result
+    return result
+
+
+# Trigger status pages and podcast apps re-present the same token many times a
+# minute. Checks are remembered for a few seconds across requests, which also
+# blunts repeated guessing. Keys are a digest, so raw secrets are never held.
+# Any token/user/subscription write clears it, but only in the process that
+# made the write: other workers keep honouring a revoked token for up to
+# _AUTH_CACHE_TTL_SECONDS. Entries hold a ready-made result with a detached
+# token, so a hit allocates nothing; callers only read from it.
+_AUTH_CACHE_TTL_SECONDS = 5.0
+_AUTH_NEGATIVE_TTL_SECONDS = 5.0
+_AUTH_CACHE_MAX_ENTRIES = 4096
+_AUTH_CACHE_LOCK = Lock()
+_AUTH_CACHE: dict[str, tuple[Optional[FeedTokenAuthResult], float]] = {}
+_GUID_SCOPED_PATHS = frozenset({"/trigger", "/api/trigger/status"})
+
+
+def _auth_scope(path: str, req: Optional[Request]) -> str:
+    """Everything the auth decision depends on besides the token itself."""
+    # Trigger endpoints resolve their feed from the guid query arg, so the same
+    # path authorizes differently per post.
+    if path in _GUID_SCOPED_PATHS:
+        guid = req.args.get("guid", "") if req is not None else ""
+        return f"{path}?guid={guid}"
+    return path
+
+
+def _auth_cache_key(token_id: str, secret: str, scope: str) -> str:
+    return hashlib.blake2b(
+        f"{token_id}:{secret}:{scope}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _cached_auth_result(key: str) -> tuple[bool, Optional[FeedTokenAuthResult]]:
+    with _AUTH_CACHE_LOCK:
+        entry = _AUTH_CACHE.get(key)
+    if entry is None:
+        return False, None
+    cached, stored_at = entry
+    ttl = _AUTH_CACHE_TTL_SECONDS if cached is not None else _AUTH_NEGATIVE_TTL_SECONDS
+    if time.monotonic() - stored_at >= ttl:
+        return False, None
+    return True, cached
+
+
+def _detached_auth_result(result: FeedTokenAuthResult) -> FeedTokenAuthResult:
+    """Copy `result` with a session-free stand-in for `.token`."""
+    token = FeedAccessToken(
+        token_id=result.token.token_id,
+        token_hash=result.token.token_hash,
+        token_secret=result.token.token_secret,
+        feed_id=result.feed_id,
+        user_id=result.user.id,
+    )
+    return FeedTokenAuthResult(
+        user=AuthenticatedUser(
+            id=result.user.id, username=result.user.username, role=result.user.role
+        ),
+        feed_id=result.feed_id,
+        token=token,
+    )
+
+
+def _store_auth_result(key: str, result: Optional[FeedTokenAuthResult]) -> None:
+    cached = _detached_auth_result(result) if result is not None else None
+    with _AUTH_CACHE_LOCK:
+        if len(_AUTH_CACHE) >= _AUTH_CACHE_MAX_ENTRIES:
+            _AUTH_CACHE.clear()
+        _AUTH_CACHE[key] = (cached, time.monotonic())
+
+
+def clear_feed_token_auth_cache(*_args: Any) -> None:
+    """Forget all cached feed token checks."""
+    with _AUTH_CACHE_LOCK:
+        _AUTH_CACHE.clear()
+
+
+for _model in (FeedAccessToken, User, UserFeedSubscription):
+    for _event_name in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event_name, clear_feed_token_auth_cache)
+# A guid that didn't resolve may start resolving once its post is added.
+event.listen(Post, "after_insert", clear_feed_token_auth_cache)
+
+
+def _authenticate_feed_token(
+    token_id: str, secret: str, path: str, *, req: Optional[Request] = None
+) -> Optional[FeedTokenAuthResult]:
+    row = (
+        db.session.query(FeedAccessToken, User)
+        .join(User, User.id == FeedAccessToken.user_id)
+        .filter(FeedAccessToken.token_id == token_id, FeedAccessToken.revoked.is_(False))
+        .first()
+    )
+    if row is None:
         return None
+    token, user = row
 
     expected_hash = _hash_token(secret)
     if not secrets.compare_digest(token.token_hash, expected_hash):
@@ -137,7 +270,6 @@ def authenticate_feed_token(
             pass  # Allow access to combined feed
         elif path.startswith("/api/posts/") or path.startswith("/post/"):
             # Check if the post belongs to a feed the user is subscribed to
-            from app.models import UserFeedSubscription  # pylint: disable=import-outside-toplevel
             post_feed_id = _resolve_feed_id(path, req=req)
             if post_feed_id is None:
                 return None
@@ -155,17 +287,20 @@ def authenticate_feed_token(
         if feed_id is None or feed_id != token.feed_id:
             return None
 
-    user = User.query.get(token.user_id)
-    if user is None:
-        return None
-
-    token.last_used_at = datetime.utcnow()
-    db.session.add(token)
-    try:
-        db.session.commit()
-    except Exception as exc:  # pylint: disable=broad-except
-        logger.error("Failed to persist feed token last_used_at: %s", exc)
-        db.session.rollback()
+    # Podcast apps hit feed/download URLs constantly; last_used_at only needs
+    # coarse resolution, so skip the commit when it was refreshed recently.
+    now = datetime.utcnow()
+    if (
+        token.last_used_at is None
+        or now - token.last_used_at >= _LAST_USED_REFRESH_INTERVAL
+    ):
+        token.last_used_at = now
+        db.session.add(token)
+        try:
+            db.session.commit()
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.error("Failed to persist feed token last_used_at: %s", exc)
+            db.session.rollback()
 
     return FeedTokenAuthResult(
         user=AuthenticatedUser(id=user.id, username=user.username, role=user.role),
@@ -191,7 +326,7 @@ def _resolve_feed_id(path: str, *, req: Optional[Request] = None) -> Optional[in
         return post.feed_id if post else None
 
     # Trigger endpoints are feed-scoped via guid query param
-    if path == "/api/trigger/status" or path == "/trigger":
+    if path in _GUID_SCOPED_PATHS:
         if req is None:
             return None
         guid = req.args.get("guid")
@@ -6,9 +6,18 @@ from typing import Any
 
 from flask import Response, current_app, g, jsonify, request, session
 
-from app.auth.feed_tokens import FeedTokenAuthResult, authenticate_feed_token
+from app.auth.feed_tokens import (
+    FeedTokenAuthResult,
+    authenticate_feed_token,
+    is_combined_token_id,
+)
+from app.auth.rate_limiter import TokenBucketRateLimiter
 from app.auth.service import AuthenticatedUser
-from app.auth.state import failure_rate_limiter
+from app.auth.state import (
+    failure_rate_limiter,
+    trigger_rate_limiter,
+    trigger_status_rate_limiter,
+)
 from app.models import User
 
 logger = logging.getLogger("global_logger")
@@ -70,6 +79,13 @@ _TOKEN_PROTECTED_PATTERNS: tuple[re.Pattern[str], ...] = (
 )
 
 
+# Throttled before token authentication so rejected polls never reach the DB.
+_TRIGGER_RATE_LIMITERS: dict[str, TokenBucketRateLimiter] = {
+    "/trigger": trigger_rate_limiter,
+    "/api/trigger/status": trigger_status_rate_limiter,
+}
+
+
 def init_auth_middleware(app: Any) -> None:
     """Attach the authentication guard to the Flask app."""
 
@@ -104,6 +120,33 @@ def init_auth_middleware(app: Any) -> None:
                 )
                 return _too_many_requests(retry_after)
 
+            bucket = _TRIGGER_RATE_LIMITERS.get(request.path)
+            if bucket is not None:
+                bucket_key = (
+                    f"{request.args.get('feed_token') or ''}:{client_identifier}"
+                )
+                throttled_for = bucket.acquire(bucket_key)
+                if throttled_for:
+                    logger.info(
+                        "TRIGGER_RATELIMIT path=%s client=%s retry_after=%d",
+                        request.path,
+                        client_identifier,
+                        throttled_for,
+                    )
+                    if request.path == "/trigger":
+                        return _trigger_page_too_many_requests(throttled_for)
+                    return _too_many_requests(throttled_for, "Too many requests")
+
+                # Combined tokens can never trigger; refuse them from the id
+                # prefix alone, before any token lookup or hashing.
+                if is_combined_token_id(request.args.get("feed_token") or ""):
+                    logger.info(
+                        "TRIGGER_AUTH_COMBINED path=%s client=%s",
+                        request.path,
+                        client_identifier,
+                    )
+                    return _combined_token_forbidden()
+
             token_result = _authenticate_feed_token_from_query()
             if token_result is None:
                 # Log auth failure with safe token prefix/suffix
@@ -186,10 +229,40 @@ def _token_unauthorized() -> Response:
     return response
 
 
-def _too_many_requests(retry_after: int) -> Response:
+def _combined_token_forbidden() -> Response:
+    """Return JSON 403 for a combined feed token on a trigger endpoint."""
+    response = jsonify({"state": "error", "message": "Combined tokens not allowed"})
+    response.status_code = 403
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+def _too_many_requests(
+    retry_after: int, message: str = "Too many authentication attempts"
+) -> Response:
     """Return JSON 429 for rate limiting (not HTML/text)."""
-    response = jsonify({"state": "error", "message": "Too many authentication attempts"})
+    response = jsonify({"state": "error", "message": message})
     response.status_code = 429
     response.headers["Retry-After"] = str(retry_after)
     response.headers["Cache-Control"] = "no-store"
     return response
+
+
+def _trigger_page_too_many_requests(retry_after: int) -> Response:
+    """Return the themed HTML 429 for /trigger, which is opened in a browser."""
+    # local import to avoid circular import with the routes package
+    from app.routes.post_routes import (  # pylint: disable=import-outside-toplevel
+        _render_trigger_error_page,
+    )
+
+    response = _render_trigger_error_page(
+        title="Too Many Requests",
+        message=(
+            "This link was opened too many times in a short period. "
+            "Please wait a minute and try again."
+        ),
+        status_code=429,
+    )
+    response.headers["Retry-After"] = str(retry_after)
+    response.headers["Cache-Control"] = "no-store"
+    return response
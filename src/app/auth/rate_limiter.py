@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import math
+import time
 from collections.abc import MutableMapping
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from threading import Lock
 
 
 @dataclass
@@ -77,3 +80,61 @@ class FailureRateLimiter:
 
         for key in stale_keys:
             del self._storage[key]
+
+
+@dataclass
+class BucketState:
+    tokens: float
+    updated_at: float
+
+
+class TokenBucketRateLimiter:
+    """In-memory token bucket per key for throttling polled endpoints."""
+
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        refill_per_second: float,
+        max_keys: int = 10000,
+    ) -> None:
+        self._capacity = float(capacity)
+        self._refill_per_second = refill_per_second
+        self._max_keys = max_keys
+        self._storage: dict[str, BucketState] = {}
+        self._lock = Lock()
+
+    def acquire(self, key: str) -> int | None:
+        """Take one token for `key`; return None if allowed, else Retry-After seconds."""
+        now = time.monotonic()
+        with self._lock:
+            state = self._storage.get(key)
+            if state is None:
+                if len(self._storage) >= self._max_keys:
+                    self._prune_full(now)
+                state = BucketState(tokens=self._capacity, updated_at=now)
+                self._storage[key] = state
+            else:
+                elapsed = now - state.updated_at
+                state.tokens = min(
+                    self._capacity, state.tokens + elapsed * self._refill_per_second
+                )
+                state.updated_at = now
+
+            if state.tokens >= 1.0:
+                state.tokens -= 1.0
+                return None
+            return max(1, math.ceil((1.0 - state.tokens) / self._refill_per_second))
+
+    def _prune_full(self, now: float) -> None:
+        # Buckets that have refilled completely carry no state worth keeping.
+        refill_window = self._capacity / self._refill_per_second
+        stale_keys = [
+            key
+            for key, state in self._storage.items()
+            if now - state.updated_at >= refill_window
+        ]
+        for key in stale_keys:
+            del self._storage[key]
+        if len(self._storage) >= self._max_keys:
+            self._storage.clear()
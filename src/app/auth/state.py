@@ -1,5 +1,10 @@
 from __future__ import annotations
 
-from .rate_limiter import FailureRateLimiter
+from .rate_limiter import FailureRateLimiter, TokenBucketRateLimiter
 
 failure_rate_limiter = FailureRateLimiter()
+
+# Per token+client throttles for the token-authenticated trigger endpoints.
+# The status endpoint is polled by the trigger page; /trigger creates jobs.
+trigger_status_rate_limiter = TokenBucketRateLimiter(capacity=60, refill_per_second=2.0)
+trigger_rate_limiter = TokenBucketRateLimiter(capacity=5, refill_per_second=1 / 60)
@@ -1,5 +1,8 @@
+import atexit
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 
 def setup_logger(
@@ -11,6 +14,8 @@ def setup_logger(
     - Emits to console exactly once (no duplicates)
     - Disables propagation to avoid duplicate root handling
     - Guards against adding duplicate handlers across repeated calls
+    - Hands records to a background listener so request threads never block
+      on file/stderr writes
     """
     file_formatter = logging.Formatter("%(asctime)s %(levelname)s %(message)s")
     console_formatter = logging.Formatter("%(levelname)s  [%(name)s] %(message)s")
@@ -20,30 +25,28 @@ def setup_logger(
     # Prevent records from also bubbling up to root logger handlers (which can cause duplicates)
     logger.propagate = False
 
+    if any(isinstance(h, QueueHandler) for h in logger.handlers):
+        return logger
+
     # Ensure directory exists for log file
     log_dir = os.path.dirname(log_file)
     if log_dir:
         os.makedirs(log_dir, exist_ok=True)
 
-    # Add file handler if not already present for this file
-    abs_log_file = os.path.abspath(log_file)
-    has_file_handler = any(
-        isinstance(h, logging.FileHandler)
-        and getattr(h, "baseFilename", None) == abs_log_file
-        for h in logger.handlers
-    )
-    if not has_file_handler:
-        file_handler = logging.FileHandler(abs_log_file)
-        file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
-
-    # Add a single console handler if not already present
-    has_stream_handler = any(
-        isinstance(h, logging.StreamHandler) for h in logger.handlers
+    file_handler = logging.FileHandler(os.path.abspath(log_file))
+    file_handler.setFormatter(file_formatter)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(console_formatter)
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
     )
-    if not has_stream_handler:
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(console_formatter)
-        logger.addHandler(stream_handler)
+    listener.start()
+    # Drain anything still queued when the process exits.
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
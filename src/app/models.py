@@ -402,6 +402,10 @@ class ProcessingJob(db.Model):  # type: ignore[name-defined, misc]
         "User", backref=db.backref("triggered_jobs", lazy="dynamic")
     )
 
+    __table_args__ = (
+        db.Index("ix_processing_job_post_guid_created_at", "post_guid", "created_at"),
+    )
+
     def __repr__(self) -> str:
         return f"<ProcessingJob {self.id} Post:{self.post_guid} Status:{self.status} Step:{self.current_step}/{self.total_steps}>"
 
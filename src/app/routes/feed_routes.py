@@ -27,7 +27,8 @@ from flask import (
 )
 from flask.typing import ResponseReturnValue
 
-from app.auth.feed_tokens import create_feed_access_token
+from app.analytics_sink import get_user_event_sink
+from app.auth.feed_tokens import clear_feed_token_auth_cache, create_feed_access_token
 from app.extensions import db
 from app.feeds import add_or_refresh_feed, generate_feed_xml, generate_combined_feed_xml, refresh_feed
 from app.jobs_manager import get_jobs_manager
@@ -40,8 +41,8 @@ from app.models import (
     PromptPreset,
     TranscriptSegment,
     User,
-    UserDownload,
 )
+from app.routes.post_routes import forget_feed_subscriptions
 from podcast_processor.podcast_downloader import sanitize_title
 from shared.processing_paths import get_in_root, get_srv_root
 
@@ -59,25 +60,22 @@ def _record_rss_read(
     """Record an RSS feed read event (podcast app polling for updates).
     
     This is separate from audio downloads - RSS reads are when the podcast app
-    fetches the feed XML to check for new episodes.
+    fetches the feed XML to check for new episodes. The row is queued on the
+    user event sink, so feed polls never wait on a commit.
     """
-    try:
-        event = UserDownload(
-            user_id=user_id,
-            post_id=None,  # Feed-level event, not episode-specific
-            feed_id=feed_id,
-            is_processed=False,
-            file_size_bytes=None,
-            download_source="rss",
-            event_type="RSS_READ",
-            auth_type=auth_type,
-            decision="SERVED",
-        )
-        db.session.add(event)
-        db.session.commit()
-    except Exception as exc:
-        logger.error(f"Failed to record RSS_READ for feed {feed_id}: {exc}")
-        db.session.rollback()
+    get_user_event_sink().put(
+        {
+            "user_id": user_id,
+            "post_id": None,  # Feed-level event, not episode-specific
+            "feed_id": feed_id,
+            "is_processed": False,
+            "file_size_bytes": None,
+            "download_source": "rss",
+            "event_type": "RSS_READ",
+            "auth_type": auth_type,
+            "decision": "SERVED",
+        }
+    )
 
 
 def _require_admin() -> ResponseReturnValue | None:
@@ -123,10 +121,12 @@ def add_feed() -> ResponseReturnValue:
         settings = current_app.config.get("AUTH_SETTINGS")
         current = getattr(g, "current_user", None)
         if settings and settings.require_auth and current and feed:
-            existing_sub = UserFeedSubscription.query.filter_by(
-                user_id=current.id, feed_id=feed.id
-            ).first()
-            if not existing_sub:
+            already_subscribed = db.session.query(
+                UserFeedSubscription.query.filter_by(
+                    user_id=current.id, feed_id=feed.id
+                ).exists()
+            ).scalar()
+            if not already_subscribed:
                 subscription = UserFeedSubscription(user_id=current.id, feed_id=feed.id)
                 db.session.add(subscription)
                 db.session.commit()
@@ -807,6 +807,8 @@ def _delete_feed_records(feed_id: int, post_ids: list[int], post_guids: list[str
     db.session.execute(text("DELETE FROM user_feed_subscription WHERE feed_id = :fid"), {"fid": feed_id})
     db.session.execute(text("DELETE FROM feed_access_token WHERE feed_id = :fid"), {"fid": feed_id})
     db.session.execute(text("DELETE FROM feed WHERE id = :fid"), {"fid": feed_id})
+    clear_feed_token_auth_cache()
+    forget_feed_subscriptions(feed_id)
 
 
 def _cleanup_feed_directories(feed: Feed) -> None:
@@ -1159,11 +1161,12 @@ def set_feed_auto_download(feed_id: int) -> ResponseReturnValue:
     subscription.auto_download_new_episodes = enabled
     db.session.commit()
 
-    global_enabled = (
-        UserFeedSubscription.query.filter_by(
-            feed_id=feed_id, auto_download_new_episodes=True
-        ).count()
-        > 0
+    global_enabled = bool(
+        db.session.query(
+            UserFeedSubscription.query.filter_by(
+                feed_id=feed_id, auto_download_new_episodes=True
+            ).exists()
+        ).scalar()
     )
 
     return jsonify(
@@ -1654,6 +1657,9 @@ def admin_unsubscribe_all(feed_id: int) -> ResponseReturnValue:
     count = UserFeedSubscription.query.filter_by(feed_id=feed_id).count()
     UserFeedSubscription.query.filter_by(feed_id=feed_id).delete()
     db.session.commit()
+    # Bulk deletes skip the mapper events that keep these caches current.
+    clear_feed_token_auth_cache()
+    forget_feed_subscriptions(feed_id)
     
     logger.info(f"Admin {user.username} unsubscribed all {count} users from feed {feed.title}")
     
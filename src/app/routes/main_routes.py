@@ -7,6 +7,7 @@ from flask import Blueprint, current_app, g, send_from_directory
 
 from app.extensions import db
 from app.models import Feed, Post
+from app.routes.post_routes import invalidate_post_read_caches
 from app.runtime_config import config
 
 logger = logging.getLogger("global_logger")
@@ -125,6 +126,7 @@ def whitelist_all(f_id: int, val: str) -> flask.Response:
     for post in feed.posts:
         post.whitelisted = val.lower() == "true"
     db.session.commit()
+    invalidate_post_read_caches(feed_id=feed.id)
     return flask.make_response("", 200)
 
 
@@ -141,5 +143,6 @@ def set_whitelist(p_guid: str, val: str) -> flask.Response:
 
     post.whitelisted = val.lower() == "true"
     db.session.commit()
+    invalidate_post_read_caches(feed_id=post.feed_id, guid=post.guid)
 
     return index()
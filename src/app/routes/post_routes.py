@@ -1,85 +1,279 @@
+import gzip
+import hashlib
 import logging
 import os
 import re
 import sys
 import time
+from collections import Counter, defaultdict
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
-from urllib.parse import quote
+from threading import BoundedSemaphore, Event, Lock
+from typing import Any, Optional, cast
+from urllib.parse import quote, urlencode
+from zlib import adler32
 
 import flask
-from flask import Blueprint, current_app, g, jsonify, request, send_file
+import jinja2
+from flask import (
+    Blueprint,
+    current_app,
+    g,
+    has_app_context,
+    has_request_context,
+    jsonify,
+    request,
+    send_file,
+)
 from flask.typing import ResponseReturnValue
-
+from sqlalchemy import case, event, exists, func, select
+from sqlalchemy.orm import Session, contains_eager, raiseload
+
+from app.analytics_sink import get_user_event_sink
+from app.auth.feed_tokens import (
+    authenticate_feed_token,
+    get_or_create_feed_token,
+    is_combined_token_id,
+)
 from app.extensions import db
+from app.feeds import _get_base_url
 from app.jobs_manager import get_jobs_manager
-from app.models import Feed, Identification, ModelCall, Post, ProcessingJob, TranscriptSegment, UserDownload, UserFeedSubscription
+from app.models import Feed, Identification, ModelCall, Post, ProcessingJob, TranscriptSegment, UserFeedSubscription
 from app.posts import clear_post_processing_data
+from shared.processing_paths import get_srv_root
 
 logger = logging.getLogger("global_logger")
 
+# Routing keys handed to JobsManager.start_post_processing on every dispatch.
+_PRIORITY_INTERACTIVE = sys.intern("interactive")
+_SOURCE_MANUAL_UI = sys.intern("manual_ui")
+_SOURCE_MANUAL_REPROCESS = sys.intern("manual_reprocess")
+_SOURCE_TRIGGER_LINK = sys.intern("trigger_link")
+
+
+# Upper bound on /trigger requests dispatching to the jobs manager at once.
+_MAX_CONCURRENT_TRIGGER_DISPATCHES = 8
+_TRIGGER_DISPATCH_SLOTS = BoundedSemaphore(_MAX_CONCURRENT_TRIGGER_DISPATCHES)
+
 
 post_bp = Blueprint("post", __name__)
 
 
-def _increment_download_count(post: Post) -> None:
-    """Safely increment the download counter for a post."""
-    try:
-        updated = Post.query.filter_by(id=post.id).update(
-            {Post.download_count: (Post.download_count or 0) + 1},
-            synchronize_session=False,
-        )
-        if updated:
-            post.download_count = (post.download_count or 0) + 1
-        db.session.commit()
-    except Exception as exc:  # pylint: disable=broad-except
-        logger.error(
-            "Failed to increment download count for post %s: %s", post.guid, exc
-        )
-        db.session.rollback()
+@lru_cache(maxsize=64)
+def _resolved_audio_path(audio_path: str) -> Path:
+    """Resolve an audio path once for the hot set of downloaded episodes.
 
+    Open file descriptors can't be pooled here: send_file closes the file it
+    is handed and concurrent readers would share its offset. Caching the
+    realpath walk is the part of the per-request open() that can be skipped.
+    """
+    return Path(audio_path).resolve()
+
+
+# Podcast apps poll unprocessed episodes for hours, so remember stat() results
+# briefly. A missing file is rechecked after a few seconds; an existing one is
+# trusted for half a minute, seeded by the worker when it records the path and
+# dropped when the path is cleared or send_file fails to find it. Files removed
+# behind the ORM's back are noticed within the TTL.
+_MISSING_AUDIO_TTL_SECONDS = 5.0
+_PRESENT_AUDIO_TTL_SECONDS = 30.0
+_AUDIO_EXISTS_LOCK = Lock()
+
+
+def _audio_exists_cache() -> dict[str, tuple[bool, float]]:
+    return current_app.extensions.setdefault("audio_exists_cache", {})  # type: ignore[no-any-return]
+
+
+def _processed_exists(audio_path: Optional[str]) -> bool:
+    """Cached `Path(audio_path).exists()` for processed audio files."""
+    if not audio_path:
+        return False
+    now = time.monotonic()
+    with _AUDIO_EXISTS_LOCK:
+        cached = _audio_exists_cache().get(audio_path)
+    if cached is not None:
+        present, checked_at = cached
+        ttl = _PRESENT_AUDIO_TTL_SECONDS if present else _MISSING_AUDIO_TTL_SECONDS
+        if now - checked_at < ttl:
+            return present
+
+    present = os.path.exists(audio_path)
+    with _AUDIO_EXISTS_LOCK:
+        cache_map = _audio_exists_cache()
+        if len(cache_map) >= 4096:
+            cache_map.clear()
+        cache_map[audio_path] = (present, now)
+    return present
+
+
+def _forget_audio_path(audio_path: Optional[str]) -> None:
+    if audio_path and has_app_context():
+        with _AUDIO_EXISTS_LOCK:
+            _audio_exists_cache().pop(audio_path, None)
+
+
+def _on_processed_audio_path_set(
+    _target: Post, value: Optional[str], oldvalue: Any, _initiator: Any
+) -> None:
+    # Processing completion and cleanup both go through this attribute. Every
+    # writer assigns a path only after the file is on disk, so a new value is
+    # known present without a stat().
+    if isinstance(oldvalue, str):
+        _forget_audio_path(oldvalue)
+    if value and has_app_context():
+        with _AUDIO_EXISTS_LOCK:
+            _audio_exists_cache()[value] = (True, time.monotonic())
+
+
+# active_history loads the old value even when the attribute wasn't, so
+# clearing the path always forgets the cached entry.
+event.listen(
+    Post.processed_audio_path,
+    "set",
+    _on_processed_audio_path_set,
+    active_history=True,
+)
+
+
+def _json_response(payload: Any, status: int = 200) -> flask.Response:
+    """Serialize a JSON payload into a response with the given status."""
+    response = flask.jsonify(payload)
+    response.status_code = status
+    return response
+
+
+# Short-lived per-app cache of serialized bodies for hot read endpoints
+# (feed post listings, post details) that the UI polls. Writes in this module
+# invalidate eagerly; the TTL bounds staleness from writers elsewhere.
+_READ_CACHE_TTL_SECONDS = 10.0
+# Every post detail view adds an entry, so cap the map; past the cap it is
+# cleared like the other per-app caches here.
+_READ_CACHE_MAX_ENTRIES = 1024
+_READ_CACHE_LOCK = Lock()
+# Processing status changes quickly, but podcast apps and the UI poll it
+# every few seconds; a tiny TTL still absorbs bursts of identical polls.
+_STATUS_CACHE_TTL_SECONDS = 2.0
+
+
+def _read_cache() -> dict[tuple[str, Any], tuple[float, bytes]]:
+    return current_app.extensions.setdefault("post_read_cache", {})  # type: ignore[no-any-return]
+
+
+def _read_cache_get(
+    key: tuple[str, Any], ttl_seconds: float = _READ_CACHE_TTL_SECONDS
+) -> bytes | None:
+    now = time.monotonic()
+    with _READ_CACHE_LOCK:
+        entry = _read_cache().get(key)
+    if entry is None or now - entry[0] >= ttl_seconds:
+        return None
+    return entry[1]
+
+
+def _read_cache_put(key: tuple[str, Any], response: flask.Response) -> flask.Response:
+    with _READ_CACHE_LOCK:
+        cache = _read_cache()
+        if len(cache) >= _READ_CACHE_MAX_ENTRIES:
+            cache.clear()
+        cache[key] = (time.monotonic(), response.get_data())
+    return response
 
-def _track_user_download(post: Post, is_processed: bool = True) -> None:
-    """Track a successful audio download for the current user if authenticated."""
-    try:
-        current_user = getattr(g, "current_user", None)
-        if not current_user:
-            return  # No user to track
-        feed_token = getattr(g, "feed_token", None)
-        download_source = "rss" if feed_token is not None else "web"
-        
-        # Determine auth_type
-        auth_type = "session"
-        if feed_token is not None:
-            auth_type = "combined" if feed_token.feed_id is None else "feed_scoped"
-        
-        # Get file size if available
-        file_size = None
-        audio_path = post.processed_audio_path if is_processed else post.unprocessed_audio_path
-        if audio_path and Path(audio_path).exists():
-            file_size = Path(audio_path).stat().st_size
-        
-        download = UserDownload(
-            user_id=current_user.id,
-            post_id=post.id,
-            is_processed=is_processed,
-            file_size_bytes=file_size,
-            download_source=download_source,
-            event_type="AUDIO_DOWNLOAD",
-            auth_type=auth_type,
-            decision="SERVED_AUDIO",  # Legacy field for backwards compat
-        )
-        db.session.add(download)
-        db.session.commit()
-    except Exception as exc:  # pylint: disable=broad-except
-        db.session.rollback()
-        logger.error(
-            "Failed to track download for user %s post %s: %s",
-            getattr(getattr(g, "current_user", None), "id", "?"),
-            post.guid,
-            exc,
-        )
+
+def _cached_json_response(body: bytes) -> flask.Response:
+    return current_app.response_class(body, mimetype="application/json")
+
+
+def _revalidated_response(
+    response: flask.Response, etag_source: Optional[bytes] = None
+) -> flask.Response:
+    """Let the client keep `response` but revalidate it on every request.
+
+    The ETag is a hash of the body (or of `etag_source` when given), so a
+    repeat request that matches gets an empty 304 instead of the full payload.
+    The body is still built for every request; only the bytes on the wire are
+    saved.
+    """
+    # private: these responses are authenticated, and trigger status bodies
+    # carry the feed secret in download_url, so shared caches must never keep
+    # them.
+    response.headers["Cache-Control"] = "private, no-cache"
+    if etag_source is None:
+        etag_source = response.get_data()
+    response.set_etag(hashlib.blake2b(etag_source, digest_size=12).hexdigest())
+    return cast(flask.Response, response.make_conditional(flask.request))
+
+
+def invalidate_post_read_caches(
+    feed_id: Optional[int] = None, guid: Optional[str] = None
+) -> None:
+    """Drop cached reads for a feed's listing and/or a single post.
+
+    Passing only `feed_id` also drops every cached post detail, since a
+    feed-wide write may have touched any of them.
+    """
+    with _READ_CACHE_LOCK:
+        cache = _read_cache()
+        if feed_id is not None:
+            cache.pop(("feed_posts", feed_id), None)
+        if guid is not None:
+            cache.pop(("post_json", guid), None)
+            cache.pop(("post_status", guid), None)
+        elif feed_id is not None:
+            for key in [key for key in cache if key[0] == "post_json"]:
+                del cache[key]
+
+
+def _build_user_download(
+    post: Post, current_user: Any, is_processed: bool
+) -> dict[str, Any]:
+    """Build the AUDIO_DOWNLOAD tracking row for an authenticated download."""
+    feed_token = getattr(g, "feed_token", None)
+    download_source = "rss" if feed_token is not None else "web"
+
+    # Determine auth_type
+    auth_type = "session"
+    if feed_token is not None:
+        auth_type = "combined" if feed_token.feed_id is None else "feed_scoped"
+
+    # Get file size if available
+    file_size = None
+    audio_path = post.processed_audio_path if is_processed else post.unprocessed_audio_path
+    if audio_path:
+        try:
+            file_size = os.stat(audio_path).st_size
+        except OSError:
+            pass
+
+    return {
+        "user_id": current_user.id,
+        "post_id": post.id,
+        "is_processed": is_processed,
+        "file_size_bytes": file_size,
+        "download_source": download_source,
+        "event_type": "AUDIO_DOWNLOAD",
+        "auth_type": auth_type,
+        "decision": "SERVED_AUDIO",  # Legacy field for backwards compat
+    }
+
+
+def _analytics_disabled() -> bool:
+    """True when SKIP_ANALYTICS is set; user activity rows are then not written."""
+    return bool(current_app.config.get("SKIP_ANALYTICS"))
+
+
+def _record_download(post: Post, is_processed: bool = True) -> None:
+    """Count a served download and queue a tracking row for the current user.
+
+    Anonymous podcast clients only bump the counter; no tracking row is built.
+    Both the counter and the tracking row are written in batches by the user
+    event sink, so the response never waits on a commit.
+    """
+    sink = get_user_event_sink()
+    sink.count_download(post.id)
+    current_user = getattr(g, "current_user", None)
+    if current_user is not None and not _analytics_disabled():
+        sink.put(_build_user_download(post, current_user, is_processed))
 
 
 def _record_user_event(
@@ -98,75 +292,122 @@ def _record_user_event(
     - PROCESS_STARTED: Processing job queued
     - PROCESS_COMPLETE: Processing finished successfully
     - FAILED: Any error (auth, processing, expired token, etc.)
+
+    Rows are buffered and bulk-inserted by the user event sink.
     """
-    try:
-        download = UserDownload(
-            user_id=current_user.id if current_user else None,
-            post_id=post.id,
-            is_processed=False,
-            file_size_bytes=None,
-            download_source=download_source,
-            event_type=event_type,
-            auth_type=auth_type,
-            decision=decision,  # Legacy field for backwards compat
-        )
-        db.session.add(download)
-        db.session.commit()
-    except Exception as exc:  # pylint: disable=broad-except
-        logger.error(
-            "Failed to record event %s for post %s: %s",
-            event_type,
-            post.guid,
-            exc,
-        )
-        db.session.rollback()
+    if _analytics_disabled():
+        return
+    get_user_event_sink().put(
+        {
+            "user_id": current_user.id if current_user else None,
+            "post_id": post.id,
+            "is_processed": False,
+            "file_size_bytes": None,
+            "download_source": download_source,
+            "event_type": event_type,
+            "auth_type": auth_type,
+            "decision": decision,  # Legacy field for backwards compat
+        }
+    )
 
 
 @post_bp.route("/api/feeds/<int:feed_id>/posts", methods=["GET"])
 def api_feed_posts(feed_id: int) -> flask.Response:
     """Returns a JSON list of posts for a specific feed."""
-    from app.models import Feed  # local import to avoid circular in other modules
+    cached = _read_cache_get(("feed_posts", feed_id))
+    if cached is not None:
+        return _revalidated_response(_cached_json_response(cached))
+
+    # Project only the columns the listing needs; rows come back as plain
+    # tuples instead of hydrated Post instances.
+    rows = (
+        Post.query.with_entities(
+            Post.id,
+            Post.guid,
+            Post.title,
+            Post.description,
+            Post.release_date,
+            Post.duration,
+            Post.whitelisted,
+            Post.processed_audio_path,
+            Post.unprocessed_audio_path,
+            Post.download_url,
+            Post.image_url,
+            Post.download_count,
+        )
+        .filter(Post.feed_id == feed_id)
+        .order_by(Post.release_date.desc())
+        .all()
+    )
+    # Any row proves the feed exists; only an empty listing needs the check
+    if not rows and not db.session.query(exists().where(Feed.id == feed_id)).scalar():
+        flask.abort(404)
 
-    # Verify feed exists
-    feed = Feed.query.get_or_404(feed_id)
-    
-    # Use optimized direct query with only needed columns
-    posts_query = Post.query.filter_by(feed_id=feed_id).order_by(Post.release_date.desc())
-    
     posts = [
         {
-            "id": post.id,
-            "guid": post.guid,
-            "title": post.title,
-            "description": post.description,
+            "id": row.id,
+            "guid": row.guid,
+            "title": row.title,
+            "description": row.description,
             "release_date": (
-                post.release_date.isoformat() if post.release_date else None
+                row.release_date.isoformat() if row.release_date else None
             ),
-            "duration": post.duration,
-            "whitelisted": post.whitelisted,
-            "has_processed_audio": post.processed_audio_path is not None,
-            "has_unprocessed_audio": post.unprocessed_audio_path is not None,
-            "download_url": post.download_url,
-            "image_url": post.image_url,
-            "download_count": post.download_count,
+            "duration": row.duration,
+            "whitelisted": row.whitelisted,
+            "has_processed_audio": row.processed_audio_path is not None,
+            "has_unprocessed_audio": row.unprocessed_audio_path is not None,
+            "download_url": row.download_url,
+            "image_url": row.image_url,
+            "download_count": row.download_count,
         }
-        for post in posts_query
+        for row in rows
     ]
-    return flask.jsonify(posts)
+    return _revalidated_response(
+        _read_cache_put(("feed_posts", feed_id), _json_response(posts))
+    )
+
+
+# Post details only preview whisper calls; cap how many rows are fetched.
+_POST_JSON_WHISPER_CALL_LIMIT = 50
+# Length of the transcript/response previews in post details.
+_PREVIEW_CHARS = 100
 
 
 @post_bp.route("/post/<path:p_guid>/json", methods=["GET"])
 def get_post_json(p_guid: str) -> flask.Response:
-    logger.info(f"API request for post details with GUID: {p_guid}")
-    post = Post.query.filter_by(guid=p_guid).first()
-    if post is None:
+    logger.info("API request for post details with GUID: %s", p_guid)
+    cached = _read_cache_get(("post_json", p_guid))
+    if cached is not None:
+        return _cached_json_response(cached)
+
+    # The post and both child counts come back in one round trip
+    row = db.session.execute(
+        select(Post, *_post_child_count_columns()).where(Post.guid == p_guid).limit(1)
+    ).first()
+    if row is None:
         return flask.make_response(jsonify({"error": "Post not found"}), 404)
 
-    segment_count = post.segments.count()
+    post, segment_count, model_call_count = row
     transcript_segments = []
 
     if segment_count > 0:
-        sample_segments = post.segments.limit(5).all()
+        # Only the first _PREVIEW_CHARS + 1 characters are fetched: enough to
+        # know whether to append "..." without shipping whole transcripts.
+        sample_segments = (
+            TranscriptSegment.query.with_entities(
+                TranscriptSegment.id,
+                TranscriptSegment.sequence_num,
+                TranscriptSegment.start_time,
+                TranscriptSegment.end_time,
+                func.substr(TranscriptSegment.text, 1, _PREVIEW_CHARS + 1).label(
+                    "text"
+                ),
+            )
+            .filter(TranscriptSegment.post_id == post.id)
+            .order_by(TranscriptSegment.sequence_num)
+            .limit(5)
+            .all()
+        )
         for segment in sample_segments:
             transcript_segments.append(
                 {
@@ -175,17 +416,34 @@ def get_post_json(p_guid: str) -> flask.Response:
                     "start_time": segment.start_time,
                     "end_time": segment.end_time,
                     "text": (
-                        segment.text[:100] + "..."
-                        if len(segment.text) > 100
+                        segment.text[:_PREVIEW_CHARS] + "..."
+                        if len(segment.text) > _PREVIEW_CHARS
                         else segment.text
                     ),
                 }
             )
 
     whisper_model_calls = []
-    for model_call in post.model_calls.filter(
-        ModelCall.model_name.like("%whisper%")
-    ).all():
+    whisper_rows = (
+        ModelCall.query.with_entities(
+            ModelCall.id,
+            ModelCall.model_name,
+            ModelCall.status,
+            ModelCall.first_segment_sequence_num,
+            ModelCall.last_segment_sequence_num,
+            ModelCall.timestamp,
+            func.substr(ModelCall.response, 1, _PREVIEW_CHARS + 1).label("response"),
+            ModelCall.error_message,
+        )
+        .filter(
+            ModelCall.post_id == post.id,
+            ModelCall.model_name.like("%whisper%"),
+        )
+        .order_by(ModelCall.first_segment_sequence_num)
+        .limit(_POST_JSON_WHISPER_CALL_LIMIT)
+        .all()
+    )
+    for model_call in whisper_rows:
         whisper_model_calls.append(
             {
                 "id": model_call.id,
@@ -197,8 +455,8 @@ def get_post_json(p_guid: str) -> flask.Response:
                     model_call.timestamp.isoformat() if model_call.timestamp else None
                 ),
                 "response": (
-                    model_call.response[:100] + "..."
-                    if model_call.response and len(model_call.response) > 100
+                    model_call.response[:_PREVIEW_CHARS] + "..."
+                    if model_call.response and len(model_call.response) > _PREVIEW_CHARS
                     else model_call.response
                 ),
                 "error": model_call.error_message,
@@ -216,13 +474,87 @@ def get_post_json(p_guid: str) -> flask.Response:
         "has_processed_audio": post.processed_audio_path is not None,
         "transcript_segment_count": segment_count,
         "transcript_sample": transcript_segments,
-        "model_call_count": post.model_calls.count(),
+        "model_call_count": model_call_count,
         "whisper_model_calls": whisper_model_calls,
         "whitelisted": post.whitelisted,
         "download_count": post.download_count,
     }
 
-    return flask.jsonify(post_data)
+    return _read_cache_put(("post_json", p_guid), _json_response(post_data))
+
+
+def _post_child_count_columns() -> tuple[Any, Any]:
+    """Correlated (transcript segment count, model call count) columns for a
+    select over Post."""
+    segment_count = (
+        select(func.count(TranscriptSegment.id))
+        .where(TranscriptSegment.post_id == Post.id)
+        .correlate(Post)
+        .scalar_subquery()
+    )
+    model_call_count = (
+        select(func.count(ModelCall.id))
+        .where(ModelCall.post_id == Post.id)
+        .correlate(Post)
+        .scalar_subquery()
+    )
+    return segment_count, model_call_count
+
+
+def _model_call_breakdown(
+    model_calls: list[ModelCall],
+) -> tuple[dict[str, int], dict[str, int]]:
+    """Count already-loaded model calls by status and by model name."""
+    statuses = Counter(call.status for call in model_calls)
+    model_names = Counter(call.model_name for call in model_calls)
+    return dict(statuses), dict(model_names)
+
+
+# The stats and debug views loop over every row these return; raiseload("*")
+# turns any relationship access not loaded up front into an error instead of
+# a silent query per row.
+
+
+def _post_model_calls(post_id: int) -> list[ModelCall]:
+    return list(
+        db.session.execute(
+            select(ModelCall)
+            .where(ModelCall.post_id == post_id)
+            .order_by(ModelCall.model_name, ModelCall.first_segment_sequence_num)
+            .options(raiseload("*"))
+        ).scalars()
+    )
+
+
+def _post_transcript_segments(post_id: int) -> list[TranscriptSegment]:
+    return list(
+        db.session.execute(
+            select(TranscriptSegment)
+            .where(TranscriptSegment.post_id == post_id)
+            .order_by(TranscriptSegment.sequence_num)
+            .options(raiseload("*"))
+        ).scalars()
+    )
+
+
+def _post_identifications(post_id: int) -> list[Identification]:
+    """A post's identifications in segment order.
+
+    identification.transcript_segment is populated from the join itself, so
+    callers looping over the result never lazy-load a segment row.
+    """
+    return list(
+        db.session.execute(
+            select(Identification)
+            .join(Identification.transcript_segment)
+            .options(
+                contains_eager(Identification.transcript_segment),
+                raiseload("*"),
+            )
+            .where(TranscriptSegment.post_id == post_id)
+            .order_by(TranscriptSegment.sequence_num)
+        ).scalars()
+    )
 
 
 @post_bp.route("/post/<path:p_guid>/debug", methods=["GET"])
@@ -232,35 +564,19 @@ def post_debug(p_guid: str) -> flask.Response:
     if post is None:
         return flask.make_response(("Post not found", 404))
 
-    model_calls = (
-        ModelCall.query.filter_by(post_id=post.id)
-        .order_by(ModelCall.model_name, ModelCall.first_segment_sequence_num)
-        .all()
-    )
-
-    transcript_segments = post.segments.all()
-
-    identifications = (
-        Identification.query.join(TranscriptSegment)
-        .filter(TranscriptSegment.post_id == post.id)
-        .order_by(TranscriptSegment.sequence_num)
-        .all()
-    )
+    model_calls = _post_model_calls(post.id)
 
-    model_call_statuses: Dict[str, int] = {}
-    model_types: Dict[str, int] = {}
+    transcript_segments = _post_transcript_segments(post.id)
 
-    for call in model_calls:
-        if call.status not in model_call_statuses:
-            model_call_statuses[call.status] = 0
-        model_call_statuses[call.status] += 1
+    identifications = _post_identifications(post.id)
 
-        if call.model_name not in model_types:
-            model_types[call.model_name] = 0
-        model_types[call.model_name] += 1
+    # The handler needs every row anyway, so tally from them rather than
+    # issuing GROUP BY queries for the same data.
+    model_call_statuses, model_types = _model_call_breakdown(model_calls)
 
-    content_segments = sum(1 for i in identifications if i.label == "content")
-    ad_segments = sum(1 for i in identifications if i.label == "ad")
+    label_counts = Counter(i.label for i in identifications)
+    content_segments = label_counts["content"]
+    ad_segments = label_counts["ad"]
 
     stats = {
         "total_segments": len(transcript_segments),
@@ -293,35 +609,32 @@ def api_post_stats(p_guid: str) -> flask.Response:
     if post is None:
         return flask.make_response(flask.jsonify({"error": "Post not found"}), 404)
 
-    model_calls = (
-        ModelCall.query.filter_by(post_id=post.id)
-        .order_by(ModelCall.model_name, ModelCall.first_segment_sequence_num)
-        .all()
-    )
-
-    transcript_segments = post.segments.all()
+    model_calls = _post_model_calls(post.id)
 
-    identifications = (
-        Identification.query.join(TranscriptSegment)
-        .filter(TranscriptSegment.post_id == post.id)
-        .order_by(TranscriptSegment.sequence_num)
-        .all()
-    )
+    transcript_segments = _post_transcript_segments(post.id)
 
-    model_call_statuses: Dict[str, int] = {}
-    model_types: Dict[str, int] = {}
+    identifications = _post_identifications(post.id)
 
-    for call in model_calls:
-        if call.status not in model_call_statuses:
-            model_call_statuses[call.status] = 0
-        model_call_statuses[call.status] += 1
+    # The handler needs every row anyway, so tally from them rather than
+    # issuing GROUP BY queries for the same data.
+    model_call_statuses, model_types = _model_call_breakdown(model_calls)
 
-        if call.model_name not in model_types:
-            model_types[call.model_name] = 0
-        model_types[call.model_name] += 1
+    label_counts = Counter(i.label for i in identifications)
+    content_segments = label_counts["content"]
+    ad_segments = label_counts["ad"]
 
-    content_segments = sum(1 for i in identifications if i.label == "content")
-    ad_segments = sum(1 for i in identifications if i.label == "ad")
+    # Bucket identifications by segment once so the per-segment loop below is
+    # linear instead of rescanning every identification for every segment.
+    identifications_by_segment: dict[int, list[Identification]] = defaultdict(list)
+    for identification in identifications:
+        identifications_by_segment[identification.transcript_segment_id].append(
+            identification
+        )
+    ad_segment_ids = {
+        segment_id
+        for segment_id, segment_identifications in identifications_by_segment.items()
+        if any(i.label == "ad" for i in segment_identifications)
+    }
 
     refined_boundaries = []
     raw_refined = getattr(post, "refined_ad_boundaries", None) or []
@@ -358,19 +671,23 @@ def api_post_stats(p_guid: str) -> flask.Response:
         for boundary in refined_boundaries
     ]
 
+    estimated_ad_time_seconds: float
     if refined_boundaries:
         estimated_ad_time_seconds = sum(
             boundary["refined_end"] - boundary["refined_start"]
             for boundary in refined_boundaries
         )
     else:
-        ad_segment_ids = {
-            i.transcript_segment_id for i in identifications if i.label == "ad"
-        }
+        # Every segment is already loaded and ad_segment_ids is a set, so one
+        # linear pass replaces a separate SUM round trip. Segments labelled
+        # "ad" by several model calls are still only counted once.
         estimated_ad_time_seconds = sum(
-            (seg.end_time - seg.start_time)
-            for seg in transcript_segments
-            if seg.id in ad_segment_ids
+            (
+                segment.end_time - segment.start_time
+                for segment in transcript_segments
+                if segment.id in ad_segment_ids
+            ),
+            0.0,
         )
 
     def _is_mixed_segment(*, seg_start: float, seg_end: float) -> bool:
@@ -405,11 +722,9 @@ def api_post_stats(p_guid: str) -> flask.Response:
     transcript_segments_data = []
     segment_mixed_by_id: Dict[int, bool] = {}
     for segment in transcript_segments:
-        segment_identifications = [
-            i for i in identifications if i.transcript_segment_id == segment.id
-        ]
+        segment_identifications = identifications_by_segment.get(segment.id, ())
 
-        has_ad_label = any(i.label == "ad" for i in segment_identifications)
+        has_ad_label = segment.id in ad_segment_ids
         primary_label = "ad" if has_ad_label else "content"
         mixed = bool(has_ad_label) and _is_mixed_segment(
             seg_start=float(segment.start_time),
@@ -525,7 +840,7 @@ def api_post_stats(p_guid: str) -> flask.Response:
         "job_info": job_info,
     }
 
-    return flask.jsonify(stats_data)
+    return _revalidated_response(_json_response(stats_data))
 
 
 @post_bp.route("/api/posts/<path:p_guid>/whitelist", methods=["POST"])
@@ -543,6 +858,7 @@ def api_toggle_whitelist(p_guid: str) -> flask.Response:
 
     post.whitelisted = bool(data["whitelisted"])
     db.session.commit()
+    invalidate_post_read_caches(feed_id=post.feed_id, guid=post.guid)
 
     return flask.jsonify(
         {
@@ -560,7 +876,16 @@ def api_toggle_whitelist_all(feed_id: int) -> flask.Response:
 
     feed = Feed.query.get_or_404(feed_id)
 
-    if not feed.posts:
+    total_count, whitelisted_count = (
+        db.session.query(
+            func.count(Post.id),
+            func.coalesce(func.sum(case((Post.whitelisted, 1), else_=0)), 0),
+        )
+        .filter(Post.feed_id == feed.id)
+        .one()
+    )
+
+    if not total_count:
         return flask.jsonify(
             {
                 "message": "No posts found in this feed",
@@ -569,21 +894,20 @@ def api_toggle_whitelist_all(feed_id: int) -> flask.Response:
             }
         )
 
-    all_whitelisted = all(post.whitelisted for post in feed.posts)
-    new_status = not all_whitelisted
-
-    for post in feed.posts:
-        post.whitelisted = new_status
+    new_status = whitelisted_count != total_count
 
+    # One UPDATE for the whole feed instead of a flush per post.
+    Post.query.filter(Post.feed_id == feed.id).update(
+        {Post.whitelisted: new_status}, synchronize_session=False
+    )
     db.session.commit()
-
-    whitelisted_count = sum(1 for post in feed.posts if post.whitelisted)
+    invalidate_post_read_caches(feed_id=feed.id)
 
     return flask.jsonify(
         {
             "message": f"{'Whitelisted' if new_status else 'Unwhitelisted'} all posts",
-            "whitelisted_count": whitelisted_count,
-            "total_count": len(feed.posts),
+            "whitelisted_count": total_count if new_status else 0,
+            "total_count": total_count,
             "all_whitelisted": new_status,
         }
     )
@@ -617,7 +941,7 @@ def api_process_post(p_guid: str) -> ResponseReturnValue:
             400,
         )
 
-    if post.processed_audio_path and os.path.exists(post.processed_audio_path):
+    if _processed_exists(post.processed_audio_path):
         return flask.jsonify(
             {
                 "status": "completed",
@@ -632,13 +956,14 @@ def api_process_post(p_guid: str) -> ResponseReturnValue:
         user_id = current_user.id if current_user else None
         
         result = get_jobs_manager().start_post_processing(
-            p_guid, priority="interactive", triggered_by_user_id=user_id,
-            trigger_source="manual_ui"
+            p_guid, priority=_PRIORITY_INTERACTIVE, triggered_by_user_id=user_id,
+            trigger_source=_SOURCE_MANUAL_UI
         )
+        invalidate_post_read_caches(guid=p_guid)
         status_code = 200 if result.get("status") in ("started", "completed") else 400
         return flask.jsonify(result), status_code
     except Exception as e:
-        logger.error(f"Failed to start processing job for {p_guid}: {e}")
+        logger.error("Failed to start processing job for %s: %s", p_guid, e)
         return (
             flask.jsonify(
                 {
@@ -684,18 +1009,20 @@ def api_reprocess_post(p_guid: str) -> ResponseReturnValue:
         current_user = getattr(g, "current_user", None)
         user_id = current_user.id if current_user else None
         
-        get_jobs_manager().cancel_post_jobs(p_guid)
+        jobs_manager = get_jobs_manager()
+        jobs_manager.cancel_post_jobs(p_guid)
         clear_post_processing_data(post)
-        result = get_jobs_manager().start_post_processing(
-            p_guid, priority="interactive", triggered_by_user_id=user_id,
-            trigger_source="manual_reprocess"
+        invalidate_post_read_caches(feed_id=post.feed_id, guid=post.guid)
+        result = jobs_manager.start_post_processing(
+            p_guid, priority=_PRIORITY_INTERACTIVE, triggered_by_user_id=user_id,
+            trigger_source=_SOURCE_MANUAL_REPROCESS
         )
         status_code = 200 if result.get("status") in ("started", "completed") else 400
         if result.get("status") == "started":
             result["message"] = "Post cleared and reprocessing started"
         return flask.jsonify(result), status_code
     except Exception as e:
-        logger.error(f"Failed to reprocess post {p_guid}: {e}", exc_info=True)
+        logger.error("Failed to reprocess post %s: %s", p_guid, e, exc_info=True)
         return (
             flask.jsonify(
                 {
@@ -711,57 +1038,73 @@ def api_reprocess_post(p_guid: str) -> ResponseReturnValue:
 @post_bp.route("/api/posts/<path:p_guid>/status", methods=["GET"])
 def api_post_status(p_guid: str) -> ResponseReturnValue:
     """Get the current processing status of a post via JobsManager."""
+    cached = _read_cache_get(("post_status", p_guid), _STATUS_CACHE_TTL_SECONDS)
+    if cached is not None:
+        return _cached_json_response(cached)
+
     result = get_jobs_manager().get_post_status(p_guid)
-    status_code = (
-        200
-        if result.get("status") != "error"
-        else (404 if result.get("error_code") == "NOT_FOUND" else 400)
-    )
+    if result.get("status") != "error":
+        return _read_cache_put(("post_status", p_guid), flask.jsonify(result))
+    status_code = 404 if result.get("error_code") == "NOT_FOUND" else 400
     return flask.jsonify(result), status_code
 
 
+def _audio_not_ready_response() -> flask.Response:
+    return flask.make_response(
+        jsonify(
+            {
+                "error": "Processed audio not available",
+                "error_code": "AUDIO_NOT_READY",
+                "message": "Post needs to be processed first",
+            }
+        ),
+        404,
+    )
+
+
 @post_bp.route("/api/posts/<path:p_guid>/audio", methods=["GET"])
 def api_get_post_audio(p_guid: str) -> ResponseReturnValue:
     """API endpoint to serve processed audio files with proper CORS headers."""
-    logger.info(f"API request for audio file with GUID: {p_guid}")
+    logger.info("API request for audio file with GUID: %s", p_guid)
 
     post = Post.query.filter_by(guid=p_guid).first()
     if post is None:
-        logger.warning(f"Post with GUID: {p_guid} not found")
+        logger.warning("Post with GUID: %s not found", p_guid)
         return flask.make_response(
             jsonify({"error": "Post not found", "error_code": "NOT_FOUND"}), 404
         )
 
     if not post.whitelisted:
-        logger.warning(f"Post: {post.title} is not whitelisted")
+        logger.warning("Post: %s is not whitelisted", post.title)
         return flask.make_response(
             jsonify({"error": "Post not whitelisted", "error_code": "NOT_WHITELISTED"}),
             403,
         )
 
-    if not post.processed_audio_path or not Path(post.processed_audio_path).exists():
-        logger.warning(f"Processed audio not found for post: {post.id}")
-        return flask.make_response(
-            jsonify(
-                {
-                    "error": "Processed audio not available",
-                    "error_code": "AUDIO_NOT_READY",
-                    "message": "Post needs to be processed first",
-                }
-            ),
-            404,
-        )
+    if not post.processed_audio_path:
+        logger.warning("Processed audio not found for post: %s", post.id)
+        return _audio_not_ready_response()
 
+    accel_response = _accel_redirect_response(post.processed_audio_path)
+    if accel_response is not None:
+        return accel_response
+
+    # No separate exists() check: send_file stats the file itself and raises
+    # FileNotFoundError if it is missing, so the path is only stat'ed once.
     try:
         response = send_file(
-            path_or_file=Path(post.processed_audio_path).resolve(),
+            path_or_file=_resolved_audio_path(post.processed_audio_path),
             mimetype="audio/mpeg",
             as_attachment=False,
         )
         response.headers["Accept-Ranges"] = "bytes"
         return response
+    except FileNotFoundError:
+        _forget_audio_path(post.processed_audio_path)
+        logger.warning("Processed audio not found for post: %s", post.id)
+        return _audio_not_ready_response()
     except Exception as e:  # pylint: disable=broad-except
-        logger.error(f"Error serving audio file for {p_guid}: {e}")
+        logger.error("Error serving audio file for %s: %s", p_guid, e)
         return flask.make_response(
             jsonify(
                 {"error": "Error serving audio file", "error_code": "SERVER_ERROR"}
@@ -777,7 +1120,14 @@ _ON_DEMAND_COOLDOWN_SECONDS = 600  # 10 minutes between triggers for same GUID
 # Podcast apps often probe with bytes=0-0, bytes=0-1023, etc. before real downloads
 _PROBE_MAX_BYTES = 1048576  # 1 MB
 
+# "bytes=<start>-<end>" with either side optional, matching the spec parsing
+# in _is_probe_request below
+_RANGE_SPEC_RE = re.compile(r"bytes=(\d*)-(\d*)\Z")
+
 
+# Clients send the same handful of Range values ("bytes=0-1", "bytes=0-")
+# over and over, so each distinct header is only parsed once.
+@lru_cache(maxsize=256)
 def _is_probe_request(range_header: str | None) -> bool:
     """Determine if a Range request is a probe (small prefetch) vs real download.
     
@@ -794,43 +1144,193 @@ def _is_probe_request(range_header: str | None) -> bool:
     """
     if not range_header:
         return False  # No Range = real download attempt
-    
-    # Parse Range header: "bytes=0-1023" or "bytes=0-" or "bytes=1024-2047"
-    if not range_header.startswith("bytes="):
-        return False
-    
-    range_spec = range_header[6:]  # Remove "bytes="
-    
-    # Handle multiple ranges (rare, treat as real download)
-    if "," in range_spec:
-        return False
-    
-    parts = range_spec.split("-")
-    if len(parts) != 2:
-        return False
-    
-    start_str, end_str = parts
-    
-    try:
-        start = int(start_str) if start_str else 0
-    except ValueError:
-        return False
-    
-    # If start > 0, this is seeking into the file = real download
-    if start > 0:
-        return False
-    
-    # If end is empty (open-ended range like "bytes=0-"), it's a real download
-    if not end_str:
+
+    # Single-range specs only; multi-range ("a-b,c-d") won't match = real download
+    match = _RANGE_SPEC_RE.match(range_header)
+    if match is None:
         return False
-    
-    try:
-        end = int(end_str)
-    except ValueError:
+
+    start_str, end_str = match.groups()
+    # Seeking into the file (start > 0) or open-ended "bytes=0-" = real download
+    if not end_str or (start_str and int(start_str) > 0):
         return False
-    
+
     # If end < _PROBE_MAX_BYTES, it's a probe
-    return end < _PROBE_MAX_BYTES
+    return int(end_str) < _PROBE_MAX_BYTES
+
+
+def _classify_probe(method: str, range_header: str | None) -> bool:
+    """HEAD requests and small leading Range requests are probes."""
+    return method == "HEAD" or _is_probe_request(range_header)
+
+
+# Podcast apps re-request the same episode many times a minute; remember the
+# session subscription check briefly instead of querying it every time.
+_SUBSCRIPTION_CACHE_TTL_SECONDS = 30.0
+_SUBSCRIPTION_CACHE_MAX_ENTRIES = 4096
+_SUBSCRIPTION_CACHE_LOCK = Lock()
+
+
+def _subscription_cache() -> dict[tuple[int, int], tuple[bool, float]]:
+    return current_app.extensions.setdefault("download_subscription_cache", {})  # type: ignore[no-any-return]
+
+
+def _has_feed_subscription(user_id: int, feed_id: int) -> bool:
+    key = (user_id, feed_id)
+    now = time.monotonic()
+    with _SUBSCRIPTION_CACHE_LOCK:
+        cached = _subscription_cache().get(key)
+    if cached is not None and now - cached[1] < _SUBSCRIPTION_CACHE_TTL_SECONDS:
+        return cached[0]
+
+    subscribed = db.session.query(
+        exists().where(
+            UserFeedSubscription.user_id == user_id,
+            UserFeedSubscription.feed_id == feed_id,
+        )
+    ).scalar()
+    with _SUBSCRIPTION_CACHE_LOCK:
+        cache_map = _subscription_cache()
+        if len(cache_map) >= _SUBSCRIPTION_CACHE_MAX_ENTRIES:
+            cache_map.clear()
+        cache_map[key] = (bool(subscribed), now)
+    return bool(subscribed)
+
+
+def _forget_subscription(
+    _mapper: Any, _connection: Any, target: UserFeedSubscription
+) -> None:
+    if not has_app_context():
+        return
+    with _SUBSCRIPTION_CACHE_LOCK:
+        _subscription_cache().pop((target.user_id, target.feed_id), None)
+
+
+event.listen(UserFeedSubscription, "after_insert", _forget_subscription)
+event.listen(UserFeedSubscription, "after_delete", _forget_subscription)
+
+
+def forget_feed_subscriptions(feed_id: int) -> None:
+    """Drop cached subscription checks for a feed after a bulk delete."""
+    with _SUBSCRIPTION_CACHE_LOCK:
+        cache_map = _subscription_cache()
+        for key in [key for key in cache_map if key[1] == feed_id]:
+            del cache_map[key]
+
+
+# Unprocessed episodes get polled hard by podcast apps; the pending/running job
+# lookup is cached per guid and dropped whenever a ProcessingJob row changes.
+_ACTIVE_JOB_CACHE_TTL_SECONDS = 10.0
+_ACTIVE_JOB_CACHE_MAX_ENTRIES = 2048
+_ACTIVE_JOB_CACHE_LOCK = Lock()
+_ACTIVE_JOB_IN_FLIGHT: dict[str, Event] = {}
+_ACTIVE_JOB_WAIT_SECONDS = 2.0
+
+
+def _active_job_cache() -> dict[str, tuple[Optional[str], float]]:
+    return current_app.extensions.setdefault("download_active_job_cache", {})  # type: ignore[no-any-return]
+
+
+def _cached_active_job(post_guid: str) -> tuple[bool, Optional[str]]:
+    with _ACTIVE_JOB_CACHE_LOCK:
+        cached = _active_job_cache().get(post_guid)
+    if cached is not None and time.monotonic() - cached[1] < _ACTIVE_JOB_CACHE_TTL_SECONDS:
+        return True, cached[0]
+    return False, None
+
+
+def _active_job_id(post_guid: str) -> Optional[str]:
+    """Return the id of a pending/running job for the post, if any.
+
+    Concurrent cache misses for the same guid are coalesced: the first
+    request runs the query and the others wait briefly for its result.
+    """
+    hit, job_id = _cached_active_job(post_guid)
+    if hit:
+        return job_id
+
+    with _ACTIVE_JOB_CACHE_LOCK:
+        in_flight = _ACTIVE_JOB_IN_FLIGHT.get(post_guid)
+        if in_flight is None:
+            _ACTIVE_JOB_IN_FLIGHT[post_guid] = Event()
+    if in_flight is not None:
+        in_flight.wait(timeout=_ACTIVE_JOB_WAIT_SECONDS)
+        hit, job_id = _cached_active_job(post_guid)
+        if hit:
+            return job_id
+
+    try:
+        job_id = cast(
+            Optional[str],
+            db.session.query(ProcessingJob.id)
+            .filter(
+                ProcessingJob.post_guid == post_guid,
+                ProcessingJob.status.in_(["pending", "running"]),
+            )
+            .limit(1)
+            .scalar(),
+        )
+        with _ACTIVE_JOB_CACHE_LOCK:
+            cache_map = _active_job_cache()
+            if len(cache_map) >= _ACTIVE_JOB_CACHE_MAX_ENTRIES:
+                cache_map.clear()
+            cache_map[post_guid] = (job_id, time.monotonic())
+    finally:
+        if in_flight is None:
+            with _ACTIVE_JOB_CACHE_LOCK:
+                leader_event = _ACTIVE_JOB_IN_FLIGHT.pop(post_guid, None)
+            if leader_event is not None:
+                leader_event.set()
+    return job_id
+
+
+def _forget_active_job(_mapper: Any, _connection: Any, target: ProcessingJob) -> None:
+    if not has_app_context():
+        return
+    # Read the loaded value directly; touching an expired attribute here
+    # would issue a query in the middle of the flush.
+    post_guid = target.__dict__.get("post_guid")
+    with _ACTIVE_JOB_CACHE_LOCK:
+        if post_guid is None:
+            _active_job_cache().clear()
+        else:
+            _active_job_cache().pop(post_guid, None)
+
+
+for _job_event in ("after_insert", "after_update", "after_delete"):
+    event.listen(ProcessingJob, _job_event, _forget_active_job)
+
+
+def _classify_auth(
+    feed_token: Any,
+    current_user: Any,
+    post: Post,
+    subscribed: Optional[bool] = None,
+) -> tuple[str, bool, bool]:
+    """Return (auth_type, is_authorized_to_read, can_trigger_processing).
+
+    `subscribed` may carry a subscription check already loaded with the post;
+    otherwise the cached lookup is used.
+
+    Auth types:
+    - "session": User logged in via web session (can trigger processing if subscribed)
+    - "feed_scoped": Feed token with specific feed_id matching post.feed_id (can trigger)
+    - "combined": Combined feed token (feed_id=None) - READ ONLY, cannot trigger processing
+    - "feed_scoped_mismatch": Feed token for a different feed - no access
+    - "none": No valid auth
+    """
+    if feed_token is not None:
+        if feed_token.feed_id is None:
+            return "combined", True, False
+        if feed_token.feed_id == post.feed_id:
+            return "feed_scoped", True, True
+        return "feed_scoped_mismatch", False, False
+    if current_user and post.feed_id:
+        if subscribed is None:
+            subscribed = _has_feed_subscription(current_user.id, post.feed_id)
+        if subscribed:
+            return "session", True, True
+    return "none", False, False
 
 
 @post_bp.route("/api/posts/<path:p_guid>/download", methods=["GET", "HEAD"])
@@ -855,113 +1355,106 @@ def api_download_post(p_guid: str) -> flask.Response:
     - 503 Service Unavailable for "not ready" (NOT 202, which confuses podcast apps)
     - Authorization via feed token in URL (podcast apps don't send cookies)
     """
-    # DEBUG: Force print to stderr to verify route is hit (bypasses logging config)
-    range_hdr = flask.request.headers.get('Range')
-    ua_hdr = flask.request.headers.get('User-Agent', '')
-    print(f"[DOWNLOAD_HIT] guid={p_guid} method={flask.request.method} range={range_hdr} ua={ua_hdr[:50]}", file=sys.stderr, flush=True)
-    
-    post = Post.query.filter_by(guid=p_guid).first()
+    started_ns = time.perf_counter_ns()
+    range_header = flask.request.headers.get("Range")
+    request_method = flask.request.method
+    user_agent = flask.request.headers.get("User-Agent", "")
+    is_probe = _classify_probe(request_method, range_header)
+
+    # Fast path for probes (HEAD / small Range) on unprocessed episodes: they
+    # always get a 204 without any auth or job lookups, so decide it from a
+    # two-column select instead of hydrating the full Post row.
+    if is_probe:
+        probe_row = (
+            Post.query.with_entities(Post.whitelisted, Post.processed_audio_path)
+            .filter(Post.guid == p_guid)
+            .first()
+        )
+        if probe_row is None:
+            logger.warning("Download request for non-existent post: %s", p_guid)
+            return _plain_response(_BODY_POST_NOT_FOUND, 404)
+        if probe_row.whitelisted and not _processed_exists(
+            probe_row.processed_audio_path
+        ):
+            _log_download_decision(
+                started_ns, p_guid, request_method, range_header, user_agent,
+                "PROBE", 204,
+            )
+            return _not_ready_response("", 204)
+
+    current_user = getattr(g, "current_user", None)
+    feed_token = getattr(g, "feed_token", None)  # FeedTokenAuthResult or None
+
+    # Session users need a subscription check; fold it into the Post lookup
+    # as a correlated EXISTS so it costs no extra round trip.
+    subscribed: Optional[bool] = None
+    if feed_token is None and current_user is not None:
+        post_row = (
+            db.session.query(
+                Post,
+                exists()
+                .where(
+                    UserFeedSubscription.user_id == current_user.id,
+                    UserFeedSubscription.feed_id == Post.feed_id,
+                )
+                .label("subscribed"),
+            )
+            .filter(Post.guid == p_guid)
+            .first()
+        )
+        post, subscribed = post_row if post_row is not None else (None, None)
+    else:
+        post = Post.query.filter_by(guid=p_guid).first()
     if post is None:
-        logger.warning(f"Download request for non-existent post: {p_guid}")
-        print(f"[DOWNLOAD_RETURN] guid={p_guid} status=404 reason=post_not_found", file=sys.stderr, flush=True)
-        return flask.make_response(("Post not found", 404))
+        logger.warning("Download request for non-existent post: %s", p_guid)
+        return _plain_response(_BODY_POST_NOT_FOUND, 404)
 
     if not post.whitelisted:
-        logger.warning(f"Download request for non-whitelisted post: {post.title}")
-        print(f"[DOWNLOAD_RETURN] guid={p_guid} status=403 reason=not_whitelisted", file=sys.stderr, flush=True)
-        return flask.make_response(("Post not whitelisted", 403))
+        logger.warning("Download request for non-whitelisted post: %s", post.title)
+        return _plain_response(_BODY_NOT_WHITELISTED, 403)
 
-    # Gather request metadata for logging and decisions
-    current_user = getattr(g, "current_user", None)
-    feed_token = getattr(g, "feed_token", None)  # FeedTokenAuthResult or None
-    range_header = flask.request.headers.get("Range")
-    user_agent = flask.request.headers.get("User-Agent", "")
-    request_method = flask.request.method
-    
-    # Detect if this is a probe request
-    is_probe = request_method == "HEAD" or _is_probe_request(range_header)
-    print(f"[DOWNLOAD_CLASSIFY] guid={post.guid} is_probe={is_probe} method={request_method} range={range_header}", file=sys.stderr, flush=True)
-    
-    # --- DETERMINE AUTH TYPE ---
-    # Auth types:
-    # - "session": User logged in via web session (can trigger processing if subscribed)
-    # - "feed_scoped": Feed token with specific feed_id matching post.feed_id (can trigger)
-    # - "combined": Combined feed token (feed_id=None) - READ ONLY, cannot trigger processing
-    # - "none": No valid auth
-    auth_type = "none"
-    is_authorized_to_read = False
-    can_trigger_processing = False
-    
-    if feed_token is not None:
-        # Authenticated via feed token
-        if feed_token.feed_id is None:
-            # Combined feed token - read access only, NO processing trigger
-            auth_type = "combined"
-            is_authorized_to_read = True
-            can_trigger_processing = False
-        elif feed_token.feed_id == post.feed_id:
-            # Feed-scoped token matching this post's feed - full access
-            auth_type = "feed_scoped"
-            is_authorized_to_read = True
-            can_trigger_processing = True
-        else:
-            # Feed-scoped token for different feed - no access
-            auth_type = "feed_scoped_mismatch"
-            is_authorized_to_read = False
-            can_trigger_processing = False
-    elif current_user and post.feed_id:
-        # Session auth - check subscription
-        subscription = UserFeedSubscription.query.filter_by(
-            user_id=current_user.id,
-            feed_id=post.feed_id,
-        ).first()
-        if subscription:
-            auth_type = "session"
-            is_authorized_to_read = True
-            can_trigger_processing = True
-    
-    # Log auth classification
-    token_feed_id = feed_token.feed_id if feed_token else None
-    user_id_for_log = current_user.id if current_user else None
-    print(f"[DOWNLOAD_AUTH] guid={post.guid} auth={auth_type} token_feed_id={token_feed_id} post_feed_id={post.feed_id} user_id={user_id_for_log} can_trigger={can_trigger_processing}", file=sys.stderr, flush=True)
+    auth_type, is_authorized_to_read, can_trigger_processing = _classify_auth(
+        feed_token, current_user, post, subscribed=subscribed
+    )
     
     # Check if episode is already processed and available
-    is_processed = post.processed_audio_path and Path(post.processed_audio_path).exists()
-    
-    # DEBUG: Log the processed state
-    print(f"[POST_STATE] guid={post.guid[:16]} processed_audio_path={post.processed_audio_path or 'None'} is_processed={is_processed} auth={auth_type} can_trigger={can_trigger_processing}", file=sys.stderr, flush=True)
-    
-    # Helper to log decision with consistent format
+    is_processed = _processed_exists(post.processed_audio_path)
+
+    # One structured record per request, emitted at the decision point
+    post_guid = post.guid
+    user_id = current_user.id if current_user else None
+    token_feed_id = feed_token.feed_id if feed_token else None
+
     def _log_decision(decision: str, status: int, extra: str = "") -> None:
-        msg = f"DOWNLOAD_DECISION post={post.guid[:16]} method={request_method} range={range_header or 'none'} ua={user_agent[:40] if user_agent else 'none'} auth={auth_type} decision={decision} status={status}{f' {extra}' if extra else ''}"
-        logger.info(msg)
-        # Also print to stderr to ensure visibility in docker logs
-        print(f"[DECISION] {msg}", file=sys.stderr, flush=True)
+        _log_download_decision(
+            started_ns, post_guid, request_method, range_header, user_agent,
+            decision, status,
+            auth_type=auth_type,
+            user_id=user_id,
+            token_feed_id=token_feed_id,
+            extra=extra,
+        )
     
     if is_processed:
         # Episode is ready - serve it (read access is sufficient)
         if not is_authorized_to_read:
             _log_decision("NOT_AUTHORIZED_READ", 401)
-            print(f"[DOWNLOAD_RETURN] guid={post.guid} status=401 reason=not_authorized_read", file=sys.stderr, flush=True)
-            return flask.make_response(("Authentication required", 401))
+            return _plain_response(_BODY_AUTH_REQUIRED, 401)
         # Fall through to file serving below
         _log_decision("SERVED_AUDIO", 200)
-        print(f"[DOWNLOAD_RETURN] guid={post.guid} status=200 reason=served_audio", file=sys.stderr, flush=True)
     else:
         # Episode not yet processed - determine response
         
         # --- TIER 1: Probes (HEAD or small Range) = never trigger ---
         if is_probe:
             _log_decision("PROBE", 204)
-            print(f"[DOWNLOAD_RETURN] guid={post.guid} status=204 reason=probe", file=sys.stderr, flush=True)
             # 204 No Content - tells client "nothing here yet" without implying retry
-            return flask.make_response(("", 204))
+            return _not_ready_response("", 204)
         
         # --- AUTHORIZATION CHECK FOR READ ---
         if not is_authorized_to_read:
             _log_decision("NOT_AUTHORIZED", 401)
-            print(f"[DOWNLOAD_RETURN] guid={post.guid} status=401 reason=not_authorized", file=sys.stderr, flush=True)
-            return flask.make_response(("Authentication required", 401))
+            return _plain_response(_BODY_AUTH_REQUIRED, 401)
         
         # --- COMBINED TOKEN: READ-ONLY, NO PROCESSING TRIGGER ---
         # Combined feed tokens can read processed audio but CANNOT trigger processing
@@ -974,85 +1467,265 @@ def api_download_post(p_guid: str) -> flask.Response:
             )
             # Return 503 Service Unavailable (NOT 202 which confuses podcast apps)
             # The episode must be processed via per-feed access or manual UI
-            print(f"[DOWNLOAD_RETURN] guid={post.guid} status=503 reason=no_trigger_combined", file=sys.stderr, flush=True)
-            response = flask.make_response(("Episode not yet processed", 503))
-            response.headers["Retry-After"] = "300"  # 5 minutes
-            return response
+            return _not_ready_response(
+                _BODY_NOT_PROCESSED, 503, retry_after=300  # 5 minutes
+            )
         
         # --- DOWNLOAD ENDPOINT DOES NOT CREATE JOBS ---
         # Per design: only /trigger can create jobs. Download endpoint is non-mutating.
         # This prevents processing storms from podcast app probes/prefetches.
         
         # Check if there's an existing job in progress
-        existing_job = ProcessingJob.query.filter(
-            ProcessingJob.post_guid == post.guid,
-            ProcessingJob.status.in_(["pending", "running"])
-        ).first()
+        existing_job_id = _active_job_id(post.guid)
         
-        if existing_job:
-            _log_decision("JOB_EXISTS", 503, f"job_id={existing_job.id}")
-            print(f"[DOWNLOAD_RETURN] guid={post.guid} status=503 reason=job_exists job_id={existing_job.id}", file=sys.stderr, flush=True)
-            response = flask.make_response(("Processing in progress", 503))
-            response.headers["Retry-After"] = "120"
-            return response
+        if existing_job_id:
+            _log_decision("JOB_EXISTS", 503, f"job_id={existing_job_id}")
+            return _not_ready_response(_BODY_JOB_IN_PROGRESS, 503, retry_after=120)
         
         # Episode not processed, no job in progress
         # Return 503 with hint to use trigger link
         _log_decision("NOT_PROCESSED", 503)
-        print(f"[DOWNLOAD_RETURN] guid={post.guid} status=503 reason=not_processed", file=sys.stderr, flush=True)
-        response = flask.make_response(("Episode not yet processed. Click the episode link in your podcast app to start processing.", 503))
-        response.headers["Retry-After"] = "300"
-        return response
+        return _not_ready_response(_BODY_NOT_PROCESSED_HINT, 503, retry_after=300)
+
+    if request_method == "HEAD":
+        head_response = _audio_head_response(
+            post.processed_audio_path, f"{post.title}.mp3"
+        )
+        if head_response is not None:
+            return head_response
+
+    accel_response = _accel_redirect_response(
+        post.processed_audio_path,
+        f"{post.title}.mp3",
+        _PROCESSED_AUDIO_CACHE_CONTROL,
+    )
+    if accel_response is not None:
+        _record_download(post, is_processed=True)
+        return accel_response
 
     try:
         response = send_file(
-            path_or_file=Path(post.processed_audio_path).resolve(),
+            path_or_file=_resolved_audio_path(post.processed_audio_path),
             mimetype="audio/mpeg",
             as_attachment=True,
             download_name=f"{post.title}.mp3",
         )
+        response.headers["Cache-Control"] = _PROCESSED_AUDIO_CACHE_CONTROL
     except Exception as e:  # pylint: disable=broad-except
-        logger.error(f"Error serving file for {p_guid}: {e}")
+        if isinstance(e, FileNotFoundError):
+            _forget_audio_path(post.processed_audio_path)
+        logger.error("Error serving file for %s: %s", p_guid, e)
         return flask.make_response(("Error serving file", 500))
 
-    _increment_download_count(post)
-    _track_user_download(post, is_processed=True)
+    if response.status_code != 304:
+        _record_download(post, is_processed=True)
+    return response
+
+
+def _log_download_decision(
+    started_ns: int,
+    guid: str,
+    method: str,
+    range_header: Optional[str],
+    user_agent: str,
+    decision: str,
+    status: int,
+    *,
+    auth_type: str = "unchecked",
+    user_id: Optional[int] = None,
+    token_feed_id: Optional[int] = None,
+    extra: str = "",
+) -> None:
+    """Emit the single DOWNLOAD_DECISION record for a download request.
+
+    The same fields are attached as `record.download_decision` for handlers
+    that format structured output.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    fields = {
+        "guid": guid,
+        "method": method,
+        "range": range_header or "none",
+        "ua": user_agent[:40] if user_agent else "none",
+        "auth_type": auth_type,
+        "user_id": user_id,
+        "token_feed_id": token_feed_id,
+        "decision": decision,
+        "status": status,
+        "latency_ms": round((time.perf_counter_ns() - started_ns) / 1e6, 2),
+    }
+    logger.info(
+        "DOWNLOAD_DECISION post=%.16s method=%s range=%s ua=%s auth=%s user_id=%s "
+        "token_feed_id=%s decision=%s status=%s latency_ms=%s%s",
+        guid,
+        fields["method"],
+        fields["range"],
+        fields["ua"],
+        auth_type,
+        user_id,
+        token_feed_id,
+        decision,
+        status,
+        fields["latency_ms"],
+        f" {extra}" if extra else "",
+        extra={"download_decision": fields},
+    )
+
+
+# Processed audio is stable but can be regenerated by a reprocess, and it is
+# only served to authorized listeners: let the client keep it for a day and
+# revalidate via send_file's ETag afterwards.
+_PROCESSED_AUDIO_CACHE_CONTROL = "private, max-age=86400"
+
+
+# Fixed bodies for the download route's early returns.
+_BODY_POST_NOT_FOUND = "Post not found"
+_BODY_NOT_WHITELISTED = "Post not whitelisted"
+_BODY_AUTH_REQUIRED = "Authentication required"
+_BODY_NOT_PROCESSED = "Episode not yet processed"
+_BODY_JOB_IN_PROGRESS = "Processing in progress"
+_BODY_NOT_PROCESSED_HINT = (
+    "Episode not yet processed. Click the episode link in your podcast app "
+    "to start processing."
+)
+
+
+def _plain_response(body: str, status: int) -> flask.Response:
+    """Build a text response directly, skipping make_response's dispatch."""
+    return current_app.response_class(body, status=status)
+
+
+def _not_ready_response(
+    body: str, status: int, retry_after: Optional[int] = None
+) -> flask.Response:
+    """204/503 for episodes that aren't ready; never cached by intermediaries."""
+    response = _plain_response(body, status)
+    response.headers["Cache-Control"] = "no-store"
+    if retry_after is not None:
+        response.headers["Retry-After"] = str(retry_after)
+    return response
+
+
+def _accel_redirect_response(
+    audio_path: str,
+    download_name: Optional[str] = None,
+    cache_control: Optional[str] = None,
+) -> Optional[flask.Response]:
+    """Hand the file transfer to nginx via X-Accel-Redirect.
+
+    nginx needs a matching internal location, e.g.::
+
+        location /internal-audio/ { internal; alias /app/src/instance/data/srv/; }
+
+    nginx handles Range itself. Without a download_name the file is served
+    inline. Returns None when redirects are disabled, for files outside the
+    srv root and for missing files; send_file serves those instead, so a
+    missing file gets the caller's usual not-found response.
+    """
+    if not current_app.config.get("USE_X_ACCEL_REDIRECT"):
+        return None
+    resolved = _resolved_audio_path(audio_path)
+    try:
+        relative = resolved.relative_to(get_srv_root().resolve())
+    except ValueError:
+        return None
+    # nginx would answer a missing file with its own bare 404 after the caller
+    # has already counted the download; one stat here avoids both.
+    if not os.path.exists(resolved):
+        _forget_audio_path(audio_path)
+        return None
+    prefix = current_app.config.get("X_ACCEL_REDIRECT_PREFIX", "/internal-audio/")
+    response = current_app.response_class(mimetype="audio/mpeg")
+    response.headers["X-Accel-Redirect"] = prefix + quote(relative.as_posix())
+    if download_name is not None:
+        response.headers["Content-Disposition"] = _attachment_disposition(download_name)
+    if cache_control is not None:
+        response.headers["Cache-Control"] = cache_control
     return response
 
 
+def _attachment_disposition(download_name: str) -> str:
+    return f"attachment; filename*=UTF-8''{quote(download_name)}"
+
+
+def _audio_head_response(
+    audio_path: str, download_name: str
+) -> Optional[flask.Response]:
+    """Answer HEAD for a processed file from one stat(), without opening it.
+
+    The ETag matches the one send_file generates for the same file, so a
+    client's follow-up If-Range/If-None-Match still validates.
+    """
+    path = os.fspath(_resolved_audio_path(audio_path))
+    try:
+        stat = os.stat(path)
+    except OSError:
+        _forget_audio_path(audio_path)
+        return None
+    response = current_app.response_class(mimetype="audio/mpeg")
+    response.content_length = stat.st_size
+    response.last_modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+    response.set_etag(
+        f"{stat.st_mtime}-{stat.st_size}-{adler32(path.encode()) & 0xFFFFFFFF}"
+    )
+    response.accept_ranges = "bytes"
+    response.headers["Content-Disposition"] = _attachment_disposition(download_name)
+    response.headers["Cache-Control"] = _PROCESSED_AUDIO_CACHE_CONTROL
+    return response
+
+
+# Original audio is immutable after download, but like processed audio it is
+# only served to authorized listeners: the client may keep it, shared caches
+# may not.
+_ORIGINAL_AUDIO_CACHE_CONTROL = "private, max-age=86400, immutable"
+
+
 @post_bp.route("/api/posts/<path:p_guid>/download/original", methods=["GET"])
 def api_download_original_post(p_guid: str) -> flask.Response:
     """API endpoint to download original (unprocessed) audio files."""
-    logger.info(f"Request to download original post with GUID: {p_guid}")
+    logger.info("Request to download original post with GUID: %s", p_guid)
     post = Post.query.filter_by(guid=p_guid).first()
     if post is None:
-        logger.warning(f"Post with GUID: {p_guid} not found")
+        logger.warning("Post with GUID: %s not found", p_guid)
         return flask.make_response(("Post not found", 404))
 
     if not post.whitelisted:
-        logger.warning(f"Post: {post.title} is not whitelisted")
+        logger.warning("Post: %s is not whitelisted", post.title)
         return flask.make_response(("Post not whitelisted", 403))
 
-    if (
-        not post.unprocessed_audio_path
-        or not Path(post.unprocessed_audio_path).exists()
-    ):
-        logger.warning(f"Original audio not found for post: {post.id}")
+    if not post.unprocessed_audio_path:
+        logger.warning("Original audio not found for post: %s", post.id)
         return flask.make_response(("Original audio not found", 404))
 
-    try:
-        response = send_file(
-            path_or_file=Path(post.unprocessed_audio_path).resolve(),
-            mimetype="audio/mpeg",
-            as_attachment=True,
-            download_name=f"{post.title}_original.mp3",
-        )
-    except Exception as e:  # pylint: disable=broad-except
-        logger.error(f"Error serving original file for {p_guid}: {e}")
-        return flask.make_response(("Error serving file", 500))
-
-    _increment_download_count(post)
-    _track_user_download(post, is_processed=False)
+    # The accel helper and send_file each stat the file themselves and fall
+    # through to the 404 below when it is missing.
+    response = _accel_redirect_response(
+        post.unprocessed_audio_path,
+        f"{post.title}_original.mp3",
+        _ORIGINAL_AUDIO_CACHE_CONTROL,
+    )
+    if response is None:
+        try:
+            response = send_file(
+                path_or_file=_resolved_audio_path(post.unprocessed_audio_path),
+                mimetype="audio/mpeg",
+                as_attachment=True,
+                download_name=f"{post.title}_original.mp3",
+            )
+            # The upstream MP3 never changes once downloaded; send_file's ETag
+            # still lets clients revalidate if the file is ever re-fetched.
+            response.headers["Cache-Control"] = _ORIGINAL_AUDIO_CACHE_CONTROL
+        except FileNotFoundError:
+            logger.warning("Original audio not found for post: %s", post.id)
+            return flask.make_response(("Original audio not found", 404))
+        except Exception as e:  # pylint: disable=broad-except
+            logger.error("Error serving original file for %s: %s", p_guid, e)
+            return flask.make_response(("Error serving file", 500))
+
+    # Only count a download once there is a file response to send.
+    if response.status_code != 304:
+        _record_download(post, is_processed=False)
     return response
 
 
@@ -1080,45 +1753,69 @@ def get_trigger_link(guid: str) -> flask.Response:
     
     Returns JSON: { "trigger_url": "https://..." }
     """
-    from app.auth.feed_tokens import get_or_create_feed_token
-    from app.feeds import _get_base_url
-    
+
     # Require session auth
     current_user = getattr(g, "current_user", None)
     if not current_user:
         return jsonify({"error": "Authentication required"}), 401
     
-    # Look up the post
-    post = Post.query.filter_by(guid=guid).first()
+    # Look up the post and its feed in one query
+    post = db.session.execute(
+        select(Post.guid, Feed.id.label("feed_id"), Feed.title.label("feed_title"))
+        .outerjoin(Feed, Feed.id == Post.feed_id)
+        .where(Post.guid == guid)
+        .limit(1)
+    ).first()
     if not post:
         return jsonify({"error": "Episode not found"}), 404
-    
-    # Get the feed for this post
-    feed = Feed.query.get(post.feed_id)
-    if not feed:
+    if post.feed_id is None:
         return jsonify({"error": "Feed not found"}), 404
     
     # Get or create a feed-scoped token for this user
-    token = get_or_create_feed_token(current_user.id, feed.id)
+    token = get_or_create_feed_token(current_user.id, post.feed_id)
     if not token:
         return jsonify({"error": "Failed to create token"}), 500
     
     # Build the public trigger URL
     base_url = _get_base_url()
     # Force HTTPS for non-localhost
-    if not base_url.startswith("http://localhost") and not base_url.startswith("http://127.0.0.1"):
+    if not base_url.startswith(("http://localhost", "http://127.0.0.1")):
         base_url = base_url.replace("http://", "https://")
     
-    trigger_url = f"{base_url}/trigger?guid={post.guid}&feed_token={token.id}&feed_secret={token.secret}"
+    trigger_url = (
+        f"{base_url}/trigger?guid={quote(post.guid, safe='')}"
+        f"&feed_token={token.id}&feed_secret={token.secret}"
+    )
     
     return jsonify({
         "trigger_url": trigger_url,
         "guid": post.guid,
-        "feed_id": feed.id,
-        "feed_title": feed.title,
+        "feed_id": post.feed_id,
+        "feed_title": post.feed_title,
     })
 
 
+def _log_trigger_event(
+    level: int, event: str, guid: Optional[str], **fields: Any
+) -> None:
+    """Log one trigger/status outcome as a single record.
+
+    The fields are attached under ``extra["trigger"]`` for structured handlers;
+    nothing is formatted when ``level`` is filtered out.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    details = " ".join(f"{key}={value}" for key, value in fields.items())
+    logger.log(
+        level,
+        "%s guid=%s %s",
+        event,
+        guid,
+        details,
+        extra={"trigger": {"event": event, "guid": guid, **fields}},
+    )
+
+
 @post_bp.route("/trigger", methods=["GET"])
 def trigger_processing() -> flask.Response:
     """Trigger processing for an episode via a capability URL.
@@ -1146,8 +1843,7 @@ def trigger_processing() -> flask.Response:
     except Exception as e:
         # Catch-all for any unexpected exceptions
         db.session.rollback()
-        logger.error(f"Unexpected error in trigger_processing: {e}", exc_info=True)
-        print(f"[TRIGGER_ERROR] unexpected_exception: {e}", file=sys.stderr, flush=True)
+        logger.error("Unexpected error in trigger_processing: %s", e, exc_info=True)
         return _render_trigger_error_page(
             title="Something Went Wrong",
             message="An unexpected error occurred. Please try again later.",
@@ -1155,36 +1851,82 @@ def trigger_processing() -> flask.Response:
         )
 
 
+def _feed_download_url(guid: str, token_id: str, secret: str) -> str:
+    """Relative processed-audio URL carrying the caller's feed token.
+
+    GUIDs may be URLs themselves, so they are percent-encoded like the RSS
+    enclosure links.
+    """
+    return "".join(
+        (
+            "/api/posts/",
+            quote(guid, safe=""),
+            "/download?feed_token=",
+            quote(token_id, safe=""),
+            "&feed_secret=",
+            quote(secret, safe=""),
+        )
+    )
+
+
+def _combined_token_trigger_response(guid: str) -> flask.Response:
+    _log_trigger_event(
+        logging.INFO,
+        "trigger_return",
+        guid,
+        status=403,
+        reason="combined_token_no_trigger",
+    )
+    return _render_trigger_error_page(
+        title="Cannot Trigger from Combined Feed",
+        message="Combined feed tokens cannot trigger processing. Please use the per-show feed URL instead.",
+        status_code=403
+    )
+
+
 def _handle_trigger_processing() -> flask.Response:
     """Internal handler for trigger processing - separated for cleaner error handling."""
-    from app.auth.feed_tokens import authenticate_feed_token
-    
+
     guid = flask.request.args.get("guid")
     token_id = flask.request.args.get("feed_token")
     secret = flask.request.args.get("feed_secret")
     
-    # Safe logging - never log secrets
-    token_prefix = token_id[:6] if token_id and len(token_id) >= 6 else token_id
-    token_suffix = token_id[-4:] if token_id and len(token_id) >= 4 else ""
-    print(f"[TRIGGER_HIT] guid={guid} token={token_prefix}...{token_suffix}", file=sys.stderr, flush=True)
-    
     # Validate required parameters
     if not guid or not token_id or not secret:
-        print(f"[TRIGGER_RETURN] status=400 reason=missing_params", file=sys.stderr, flush=True)
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_return",
+            guid,
+            status=400,
+            reason="missing_params",
+        )
         return _render_trigger_error_page(
             title="Missing Parameters",
             message="Required parameters: guid, feed_token, feed_secret",
             status_code=400
         )
     
+    # Prefixed combined tokens are rejected before any lookup or hashing
+    if is_combined_token_id(token_id):
+        return _combined_token_trigger_response(guid)
+    
     # Authenticate the token - use actual request path so _resolve_feed_id can extract guid
     try:
         auth_result = authenticate_feed_token(
             token_id, secret, flask.request.path, req=flask.request
         )
     except Exception as e:
-        logger.error(f"Token authentication failed for guid={guid}: {e}", exc_info=True)
-        print(f"[TRIGGER_RETURN] status=401 reason=auth_exception error={e}", file=sys.stderr, flush=True)
+        logger.error(
+            "Token authentication failed for guid=%s: %s", guid, e, exc_info=True
+        )
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_return",
+            guid,
+            status=401,
+            reason="auth_exception",
+            error=e,
+        )
         return _render_trigger_error_page(
             title="Authentication Error",
             message="Failed to verify your access token. Please try getting a fresh link.",
@@ -1192,37 +1934,66 @@ def _handle_trigger_processing() -> flask.Response:
         )
     
     if not auth_result:
-        print(f"[TRIGGER_RETURN] status=403 reason=invalid_token", file=sys.stderr, flush=True)
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_return",
+            guid,
+            status=403,
+            reason="invalid_token",
+        )
         return _render_trigger_error_page(
             title="Invalid Token",
             message="The link has expired or is invalid. Please get a fresh link from your podcast app.",
             status_code=403
         )
     
-    print(f"[TRIGGER_AUTH] guid={guid} feed_id={auth_result.feed_id} user_id={auth_result.user.id}", file=sys.stderr, flush=True)
-    
     # Combined tokens (feed_id=None) cannot trigger processing
     if auth_result.feed_id is None:
-        print(f"[TRIGGER_RETURN] status=403 reason=combined_token_no_trigger", file=sys.stderr, flush=True)
-        return _render_trigger_error_page(
-            title="Cannot Trigger from Combined Feed",
-            message="Combined feed tokens cannot trigger processing. Please use the per-show feed URL instead.",
-            status_code=403
+        return _combined_token_trigger_response(guid)
+    
+    # Post, feed title and the most recent job in one round-trip; the job
+    # doubles as the in-progress check and the cooldown reference below.
+    latest_job_id = (
+        select(ProcessingJob.id)
+        .where(ProcessingJob.post_guid == Post.guid)
+        .order_by(ProcessingJob.created_at.desc())
+        .limit(1)
+        .correlate(Post)
+        .scalar_subquery()
+    )
+    row = db.session.execute(
+        select(Post, Feed.title, ProcessingJob)
+        .outerjoin(Feed, Feed.id == Post.feed_id)
+        .outerjoin(ProcessingJob, ProcessingJob.id == latest_job_id)
+        .where(Post.guid == guid)
+        .limit(1)
+    ).first()
+    if row is None:
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_return",
+            guid,
+            status=404,
+            reason="post_not_found",
         )
-    
-    # Look up the post
-    post = Post.query.filter_by(guid=guid).first()
-    if not post:
-        print(f"[TRIGGER_RETURN] status=404 reason=post_not_found", file=sys.stderr, flush=True)
         return _render_trigger_error_page(
             title="Episode Not Found",
             message="This episode could not be found. It may have been removed.",
             status_code=404
         )
+    post, feed_title, last_job = row
     
     # Verify the token's feed_id matches the post's feed_id
     if post.feed_id != auth_result.feed_id:
-        print(f"[TRIGGER_RETURN] status=403 reason=feed_mismatch token_feed={auth_result.feed_id} post_feed={post.feed_id}", file=sys.stderr, flush=True)
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_return",
+            guid,
+            status=403,
+            reason="feed_mismatch",
+            token_feed_id=auth_result.feed_id,
+            post_feed_id=post.feed_id,
+        )
         return _render_trigger_error_page(
             title="Access Denied",
             message="This token is not authorized for this episode.",
@@ -1231,26 +2002,36 @@ def _handle_trigger_processing() -> flask.Response:
     
     # Check if episode is eligible (whitelisted)
     if not post.whitelisted:
-        print(f"[TRIGGER_RETURN] status=409 reason=not_whitelisted", file=sys.stderr, flush=True)
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_return",
+            guid,
+            status=409,
+            reason="not_whitelisted",
+        )
         return _render_trigger_error_page(
             title="Episode Not Enabled",
             message="This episode is not enabled for processing. Enable it in the Podly web interface first.",
             status_code=409
         )
     
-    # Get feed info for display
-    feed = Feed.query.get(post.feed_id)
-    feed_title = feed.title if feed else "Unknown Show"
+    feed_title = feed_title or "Unknown Show"
     
     # Build download URL for when ready
-    download_url = f"/api/posts/{post.guid}/download?feed_token={token_id}&feed_secret={secret}"
+    download_url = _feed_download_url(post.guid, token_id, secret)
     
     # Record trigger page open event
     _record_user_event(post, auth_result.user, "TRIGGER_OPEN", "feed_scoped", "", "trigger")
     
     # Check if already processed
-    if post.processed_audio_path and Path(post.processed_audio_path).exists():
-        print(f"[TRIGGER_RETURN] status=200 reason=already_processed", file=sys.stderr, flush=True)
+    if _processed_exists(post.processed_audio_path):
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_return",
+            guid,
+            status=200,
+            reason="already_processed",
+        )
         return _render_trigger_page(
             title="Episode Ready",
             message=f"'{post.title}' is ready to play!",
@@ -1263,13 +2044,19 @@ def _handle_trigger_processing() -> flask.Response:
         )
     
     # Check for existing pending/running job
-    existing_job = ProcessingJob.query.filter(
-        ProcessingJob.post_guid == post.guid,
-        ProcessingJob.status.in_(["pending", "running"])
-    ).first()
+    existing_job = (
+        last_job if last_job and last_job.status in ("pending", "running") else None
+    )
     
     if existing_job:
-        print(f"[TRIGGER_JOB] guid={guid} action=existing job_id={existing_job.id} status={existing_job.status}", file=sys.stderr, flush=True)
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_job",
+            guid,
+            action="existing",
+            job_id=existing_job.id,
+            job_status=existing_job.status,
+        )
         return _render_trigger_page(
             title="Processing In Progress",
             message=f"'{post.title}' is being processed.",
@@ -1283,16 +2070,19 @@ def _handle_trigger_processing() -> flask.Response:
         )
     
     # Check cooldown (10 minutes)
-    _TRIGGER_COOLDOWN_SECONDS = 600
-    last_job = ProcessingJob.query.filter(
-        ProcessingJob.post_guid == post.guid
-    ).order_by(ProcessingJob.created_at.desc()).first()
-    
     if last_job and last_job.created_at:
-        job_age = (datetime.now(timezone.utc) - last_job.created_at.replace(tzinfo=timezone.utc)).total_seconds()
-        if job_age < _TRIGGER_COOLDOWN_SECONDS:
-            remaining = int(_TRIGGER_COOLDOWN_SECONDS - job_age)
-            print(f"[TRIGGER_RETURN] status=200 reason=cooldown remaining={remaining}s", file=sys.stderr, flush=True)
+        # created_at is naive UTC; compare epoch seconds directly
+        job_age = time.time() - last_job.created_at.replace(tzinfo=timezone.utc).timestamp()
+        if job_age < _ON_DEMAND_COOLDOWN_SECONDS:
+            remaining = int(_ON_DEMAND_COOLDOWN_SECONDS - job_age)
+            _log_trigger_event(
+                logging.INFO,
+                "trigger_return",
+                guid,
+                status=200,
+                reason="cooldown",
+                remaining_seconds=remaining,
+            )
             return _render_trigger_page(
                 title="Please Wait",
                 message=f"Processing was recently attempted. Please wait {remaining // 60 + 1} minutes.",
@@ -1302,44 +2092,82 @@ def _handle_trigger_processing() -> flask.Response:
                 cooldown_remaining=remaining
             )
     
-    # Trigger processing
+    # Admission control: shed bursts (e.g. crawler storms on trigger links)
+    # instead of letting every request pile onto the jobs manager and DB pool.
+    if not _TRIGGER_DISPATCH_SLOTS.acquire(blocking=False):
+        logger.warning("Dropping trigger for %s: dispatch slots exhausted", guid)
+        _log_trigger_event(
+            logging.INFO,
+            "trigger_return",
+            guid,
+            status=503,
+            reason="dispatch_full",
+        )
+        return _render_trigger_error_page(
+            title="Server Busy",
+            message="Too many episodes are being queued right now. Please try again in a minute.",
+            status_code=503
+        )
+
+    # Trigger processing. start_post_processing only records a pending job and
+    # wakes the JobsManager worker thread, so the request never waits on the
+    # download/transcribe/classify pipeline itself.
+    user_id = auth_result.user.id
+    _log_trigger_event(
+        logging.INFO,
+        "trigger_job",
+        guid,
+        action="create",
+        user_id=user_id,
+    )
+    # Only the dispatch is guarded here; anything after it is covered by the
+    # catch-all in trigger_processing.
     try:
-        user_id = auth_result.user.id
-        print(f"[TRIGGER_JOB] guid={guid} action=create user_id={user_id}", file=sys.stderr, flush=True)
         result = get_jobs_manager().start_post_processing(
             post.guid,
-            priority="interactive",
+            priority=_PRIORITY_INTERACTIVE,
             triggered_by_user_id=user_id,
-            trigger_source="trigger_link",
-        )
-        job_id = result.get("job_id")
-        print(f"[TRIGGER_JOB] guid={guid} action=created job_id={job_id}", file=sys.stderr, flush=True)
-        
-        # Record process started event
-        _record_user_event(post, auth_result.user, "PROCESS_STARTED", "feed_scoped", "TRIGGERED", "trigger")
-        
-        # Fetch the job we just created
-        job = ProcessingJob.query.get(job_id) if job_id else None
-        
-        return _render_trigger_page(
-            title="Processing Started",
-            message=f"'{post.title}' has been queued for ad removal.",
-            state="processing",
-            post=post,
-            feed_title=feed_title,
-            download_url=download_url,
-            token_id=token_id,
-            secret=secret,
-            job=job
+            trigger_source=_SOURCE_TRIGGER_LINK,
         )
     except Exception as e:
-        logger.error(f"Failed to trigger processing for {guid}: {e}", exc_info=True)
-        print(f"[TRIGGER_JOB] guid={guid} action=error error={e}", file=sys.stderr, flush=True)
+        logger.error("Failed to trigger processing for %s: %s", guid, e, exc_info=True)
+        _log_trigger_event(logging.INFO, "trigger_job", guid, action="error", error=e)
         return _render_trigger_error_page(
             title="Processing Error",
             message="Failed to start processing. Please try again in a few minutes.",
             status_code=500
         )
+    finally:
+        _TRIGGER_DISPATCH_SLOTS.release()
+    invalidate_post_read_caches(guid=post.guid)
+
+    job_id = result.get("job_id")
+    _log_trigger_event(
+        logging.INFO,
+        "trigger_job",
+        guid,
+        action="created",
+        job_id=job_id,
+    )
+    # `result` is a dict; only pay for its repr when INFO is actually emitted.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("On-demand processing started for %s: %s", post.guid, result)
+
+    # Record process started event
+    _record_user_event(post, auth_result.user, "PROCESS_STARTED", "feed_scoped", "TRIGGERED", "trigger")
+    
+    # The job was only just queued, so there is no progress worth a query for;
+    # the page renders it as "Queued" at 0%.
+    return _render_trigger_page(
+        title="Processing Started",
+        message=f"'{post.title}' has been queued for ad removal.",
+        state="processing",
+        post=post,
+        feed_title=feed_title,
+        download_url=download_url,
+        token_id=token_id,
+        secret=secret,
+    )
 
 
 def _format_error_for_user(raw_error: str | None) -> dict:
@@ -1488,64 +2316,216 @@ def _format_error_for_user(raw_error: str | None) -> dict:
     }
 
 
-def _normalize_job(job: ProcessingJob, download_url: str | None = None) -> dict:
-    """Normalize a ProcessingJob to a safe JSON-serializable dict with defaults.
+_JOB_SNAPSHOT_FIELDS = (
+    "id",
+    "status",
+    "current_step",
+    "total_steps",
+    "step_name",
+    "progress_percentage",
+    "created_at",
+    "started_at",
+    "error_message",
+)
+
+
+def _job_snapshot(job: ProcessingJob) -> dict[str, Any]:
+    """Plain-dict copy of the ProcessingJob columns the status API reports."""
+    return {field: getattr(job, field) for field in _JOB_SNAPSHOT_FIELDS}
+
+
+# Step names by current_step, for when step_name is NULL
+_STEP_NAMES = (
+    "Initializing",
+    "Downloading",
+    "Transcribing",
+    "Detecting Ads",
+    "Processing Audio",
+)
+_JOB_STATUS_TO_STATE = {
+    "running": "processing",
+    "pending": "queued",
+    "completed": "ready",
+    "failed": "failed",
+}
+
+
+def _normalize_job(
+    job: ProcessingJob | dict[str, Any], download_url: str | None = None
+) -> dict:
+    """Normalize a ProcessingJob (or its snapshot) to a safe JSON-serializable
+    dict with defaults.
 
     Handles NULL fields that can occur during early processing stages.
     """
-    # Step name mapping for when step_name is NULL
-    STEP_NAMES = {
-        0: "Initializing",
-        1: "Downloading",
-        2: "Transcribing", 
-        3: "Detecting Ads",
-        4: "Processing Audio",
-    }
+    if not isinstance(job, dict):
+        job = _job_snapshot(job)
     
     # Safe defaults for potentially NULL fields
-    current_step = job.current_step if job.current_step is not None else 0
-    total_steps = job.total_steps if job.total_steps and job.total_steps > 0 else 4
-    step_name = job.step_name or STEP_NAMES.get(current_step, "Processing")
+    current_step = job["current_step"] if job["current_step"] is not None else 0
+    total_steps = job["total_steps"] if job["total_steps"] and job["total_steps"] > 0 else 4
+    step_name = job["step_name"] or (
+        _STEP_NAMES[current_step]
+        if 0 <= current_step < len(_STEP_NAMES)
+        else "Processing"
+    )
     
     # Calculate progress percentage with guards
-    if job.progress_percentage is not None:
-        progress = max(0, min(100, int(job.progress_percentage)))
+    if job["progress_percentage"] is not None:
+        progress = max(0, min(100, int(job["progress_percentage"])))
     elif total_steps > 0:
         progress = min(100, int((current_step / total_steps) * 100))
     else:
         progress = 0
     
-    # Determine state from job status
-    if job.status == "running":
-        state = "processing"
-    elif job.status == "pending":
-        state = "queued"
-    elif job.status == "completed":
-        state = "ready"
-    elif job.status == "failed":
-        state = "failed"
-    else:
-        state = "processing"  # Default for unknown status
+    # Determine state from job status; unknown statuses read as processing
+    status = job["status"]
+    state = _JOB_STATUS_TO_STATE.get(status, "processing")
     
     return {
         "state": state,
-        "processed": job.status == "completed",
+        "processed": status == "completed",
         "download_url": download_url,
         "message": f"Step {current_step}/{total_steps}: {step_name}",
         "job": {
-            "id": job.id,
-            "status": job.status or "unknown",
+            "id": job["id"],
+            "status": status or "unknown",
             "current_step": current_step,
             "total_steps": total_steps,
             "step_name": step_name,
             "progress_percentage": progress,
-            "created_at": job.created_at.isoformat() if job.created_at else None,
-            "started_at": job.started_at.isoformat() if job.started_at else None,
-            "error_message": getattr(job, 'error_message', None),
+            "created_at": job["created_at"].isoformat() if job["created_at"] else None,
+            "started_at": job["started_at"].isoformat() if job["started_at"] else None,
+            "error_message": job["error_message"],
         }
     }
 
 
+# /api/trigger/status is polled every few seconds while a job runs. Keep the
+# active / last-failed job per guid in memory: job writes from the worker push
+# their new state in here, so polls between steps never touch the database.
+_TRIGGER_JOB_STATE_TTL_SECONDS = 30.0
+_TRIGGER_JOB_STATE_LOCK = Lock()
+
+_TriggerJobState = tuple[Optional[dict[str, Any]], Optional[dict[str, Any]]]
+
+
+def _trigger_job_states() -> dict[str, tuple[_TriggerJobState, float]]:
+    return current_app.extensions.setdefault("trigger_job_state", {})  # type: ignore[no-any-return]
+
+
+def _trigger_job_state(post_guid: str) -> _TriggerJobState:
+    """Return (active_job, last_failed_job) snapshots for the post."""
+    now = time.monotonic()
+    with _TRIGGER_JOB_STATE_LOCK:
+        cached = _trigger_job_states().get(post_guid)
+    if cached is not None and now - cached[1] < _TRIGGER_JOB_STATE_TTL_SECONDS:
+        return cached[0]
+
+    active_job = ProcessingJob.query.filter(
+        ProcessingJob.post_guid == post_guid,
+        ProcessingJob.status.in_(["pending", "running"])
+    ).first()
+    state: _TriggerJobState
+    if active_job is not None:
+        state = (_job_snapshot(active_job), None)
+    else:
+        last_job = ProcessingJob.query.filter(
+            ProcessingJob.post_guid == post_guid
+        ).order_by(ProcessingJob.created_at.desc()).first()
+        failed = last_job is not None and last_job.status == "failed"
+        state = (None, _job_snapshot(last_job) if failed else None)
+
+    with _TRIGGER_JOB_STATE_LOCK:
+        _trigger_job_states()[post_guid] = (state, now)
+    return state
+
+
+def _push_trigger_job_state(
+    _mapper: Any, _connection: Any, target: ProcessingJob
+) -> None:
+    if not has_app_context():
+        return
+    loaded = target.__dict__
+    post_guid = loaded.get("post_guid")
+    with _TRIGGER_JOB_STATE_LOCK:
+        states = _trigger_job_states()
+        if post_guid is None:
+            states.clear()
+        elif loaded.get("status") in ("pending", "running") and all(
+            field in loaded for field in _JOB_SNAPSHOT_FIELDS
+        ):
+            snapshot = {field: loaded[field] for field in _JOB_SNAPSHOT_FIELDS}
+            states[post_guid] = ((snapshot, None), time.monotonic())
+        else:
+            states.pop(post_guid, None)
+
+
+for _job_event in ("after_insert", "after_update", "after_delete"):
+    event.listen(ProcessingJob, _job_event, _push_trigger_job_state)
+
+
+def _forget_trigger_job_states_after_bulk_delete(delete_context: Any) -> None:
+    # Query.delete() (clearing a post's data, job history cleanup) skips the
+    # mapper events above, so drop every cached job state for it.
+    if delete_context.mapper.class_ is not ProcessingJob or not has_app_context():
+        return
+    with _TRIGGER_JOB_STATE_LOCK:
+        _trigger_job_states().clear()
+
+
+event.listen(Session, "after_bulk_delete", _forget_trigger_job_states_after_bulk_delete)
+
+
+# Server-side pacing for the trigger page's status poll. Waitress serves from a
+# small fixed thread pool, so a held-open event stream per viewer would starve
+# it; instead each non-terminal response tells the client when to ask again.
+_TRIGGER_POLL_AFTER_MS = {"queued": 5000, "processing": 2000, "not_started": 10000}
+_MIN_POLL_AFTER_MS = 500
+_MAX_POLL_AFTER_MS = 10000
+
+
+def _trigger_poll_after_ms(job: dict[str, Any], state: str, progress: int) -> int:
+    """Spread roughly ten polls across a running job's remaining ETA.
+
+    The ETA extrapolates the elapsed time from the job's progress so far, so
+    the hint grows while progress stalls. It is rounded to the nearest
+    _MIN_POLL_AFTER_MS and left out of the ETag (see _revalidated_json).
+    """
+    if progress > 90:
+        return _MIN_POLL_AFTER_MS
+    started_at = job["started_at"]
+    if state != "processing" or started_at is None or progress <= 0:
+        return _TRIGGER_POLL_AFTER_MS.get(state, 2000)
+    elapsed = time.time() - started_at.replace(tzinfo=timezone.utc).timestamp()
+    remaining_ms = max(0.0, elapsed) * (100 - progress) / progress * 1000
+    poll_after_ms = (
+        int(round(remaining_ms / 10 / _MIN_POLL_AFTER_MS)) * _MIN_POLL_AFTER_MS
+    )
+    return max(_MIN_POLL_AFTER_MS, min(_MAX_POLL_AFTER_MS, poll_after_ms))
+
+
+def _no_store_json(payload: Any, status: int = 200) -> flask.Response:
+    """JSON response for the trigger status poll, which must never be cached."""
+    response = _json_response(payload, status)
+    response.headers["Cache-Control"] = "no-store"
+    return response
+
+
+def _revalidated_json(payload: dict[str, Any]) -> flask.Response:
+    """JSON response for a successful status poll.
+
+    The browser may keep it but must revalidate every time, so polls that see
+    no change get an empty 304 instead of the full body. poll_after_ms is
+    derived from elapsed time and is not a status change, so it is left out
+    of the ETag; a 304 leaves the client on its cached, shorter hint.
+    """
+    status = {key: value for key, value in payload.items() if key != "poll_after_ms"}
+    return _revalidated_response(
+        _json_response(payload), current_app.json.dumps(status).encode("utf-8")
+    )
+
+
 @post_bp.route("/api/trigger/status", methods=["GET", "OPTIONS"])
 def trigger_status() -> flask.Response:
     """Get processing status for an episode (JSON endpoint for polling).
@@ -1563,49 +2543,58 @@ def trigger_status() -> flask.Response:
         response.headers["Cache-Control"] = "no-store"
         return response
     guid = flask.request.args.get("guid")
-    token_id = flask.request.args.get("feed_token")
     
     try:
         return _handle_trigger_status()
     except Exception:
-        # Use logger.exception for automatic full traceback - never log secrets
-        flask.current_app.logger.exception(
-            "[TRIGGER_STATUS_500] guid=%s path=%s args=%s",
+        # Never log secrets
+        logger.exception(
+            "trigger_status_500 guid=%s",
             guid,
-            flask.request.path,
-            {k: v for k, v in flask.request.args.items() if k != "feed_secret"},
+            extra={"trigger": {"event": "trigger_status_500", "guid": guid}},
         )
-        
+
         # Return 503 for temporary server errors - UI will show banner and retry
-        response = flask.jsonify({
+        return _no_store_json({
             "state": "error",
             "message": "Temporarily unavailable",
             "processed": False,
             "download_url": None,
             "job": None
-        })
-        response.headers["Cache-Control"] = "no-store"
-        return response, 503
+        }, 503)
+
+
+def _combined_token_status_response(guid: str) -> flask.Response:
+    _log_trigger_event(
+        logging.DEBUG,
+        "trigger_status_return",
+        guid,
+        status=403,
+        reason="combined_token",
+    )
+    return _no_store_json({"state": "error", "message": "Combined tokens not allowed"}, 403)
 
 
 def _handle_trigger_status() -> flask.Response:
     """Internal handler for trigger status - separated for cleaner error handling."""
-    from app.auth.feed_tokens import authenticate_feed_token
-    
+
     guid = flask.request.args.get("guid")
     token_id = flask.request.args.get("feed_token")
     secret = flask.request.args.get("feed_secret")
     
-    # Safe logging - never log secrets
-    token_prefix = token_id[:6] if token_id and len(token_id) >= 6 else token_id
-    token_suffix = token_id[-4:] if token_id and len(token_id) >= 4 else ""
-    print(f"[TRIGGER_STATUS] guid={guid} token={token_prefix}...{token_suffix}", file=sys.stderr, flush=True)
-    
     if not guid or not token_id or not secret:
-        print(f"[TRIGGER_STATUS_RETURN] status=400 reason=missing_params", file=sys.stderr, flush=True)
-        response = flask.jsonify({"state": "error", "message": "Missing required parameters"})
-        response.headers["Cache-Control"] = "no-store"
-        return response, 400
+        _log_trigger_event(
+            logging.DEBUG,
+            "trigger_status_return",
+            guid,
+            status=400,
+            reason="missing_params",
+        )
+        return _no_store_json({"state": "error", "message": "Missing required parameters"}, 400)
+    
+    # Prefixed combined tokens are rejected before any lookup or hashing
+    if is_combined_token_id(token_id):
+        return _combined_token_status_response(guid)
     
     # Authenticate the token - use actual request path so _resolve_feed_id can extract guid
     try:
@@ -1613,122 +2602,127 @@ def _handle_trigger_status() -> flask.Response:
             token_id, secret, flask.request.path, req=flask.request
         )
     except Exception as auth_err:
-        logger.error(f"Token auth exception for guid={guid}: {auth_err}", exc_info=True)
-        print(f"[TRIGGER_STATUS_RETURN] status=401 reason=auth_exception", file=sys.stderr, flush=True)
-        response = flask.jsonify({"state": "error", "message": "Authentication failed"})
-        response.headers["Cache-Control"] = "no-store"
-        return response, 401
+        logger.error(
+            "Token auth exception for guid=%s: %s", guid, auth_err, exc_info=True
+        )
+        _log_trigger_event(
+            logging.DEBUG,
+            "trigger_status_return",
+            guid,
+            status=401,
+            reason="auth_exception",
+        )
+        return _no_store_json({"state": "error", "message": "Authentication failed"}, 401)
     
     if not auth_result:
-        print(f"[TRIGGER_STATUS_RETURN] status=401 reason=invalid_token", file=sys.stderr, flush=True)
-        response = flask.jsonify({"state": "error", "message": "Invalid or expired token"})
-        response.headers["Cache-Control"] = "no-store"
-        return response, 401
+        _log_trigger_event(
+            logging.DEBUG,
+            "trigger_status_return",
+            guid,
+            status=401,
+            reason="invalid_token",
+        )
+        return _no_store_json({"state": "error", "message": "Invalid or expired token"}, 401)
     
     # Combined tokens cannot access status
     if auth_result.feed_id is None:
-        print(f"[TRIGGER_STATUS_RETURN] status=403 reason=combined_token", file=sys.stderr, flush=True)
-        response = flask.jsonify({"state": "error", "message": "Combined tokens not allowed"})
-        response.headers["Cache-Control"] = "no-store"
-        return response, 403
+        return _combined_token_status_response(guid)
     
-    # Look up the post
-    post = Post.query.filter_by(guid=guid).first()
+    # Look up the post (only the columns the status response needs)
+    post = (
+        Post.query.with_entities(Post.guid, Post.feed_id, Post.processed_audio_path)
+        .filter(Post.guid == guid)
+        .first()
+    )
     if not post:
-        print(f"[TRIGGER_STATUS_RETURN] status=404 reason=post_not_found", file=sys.stderr, flush=True)
-        response = flask.jsonify({"state": "not_found", "message": "Episode not found"})
-        response.headers["Cache-Control"] = "no-store"
-        return response, 404
+        _log_trigger_event(
+            logging.DEBUG,
+            "trigger_status_return",
+            guid,
+            status=404,
+            reason="post_not_found",
+        )
+        return _no_store_json({"state": "not_found", "message": "Episode not found"}, 404)
     
     # Verify feed match
     if post.feed_id != auth_result.feed_id:
-        print(f"[TRIGGER_STATUS_RETURN] status=403 reason=feed_mismatch", file=sys.stderr, flush=True)
-        response = flask.jsonify({"state": "error", "message": "Token not authorized for this episode"})
-        response.headers["Cache-Control"] = "no-store"
-        return response, 403
+        _log_trigger_event(
+            logging.DEBUG,
+            "trigger_status_return",
+            guid,
+            status=403,
+            reason="feed_mismatch",
+        )
+        return _no_store_json({"state": "error", "message": "Token not authorized for this episode"}, 403)
     
     # Build download URL
-    download_url = f"/api/posts/{post.guid}/download?feed_token={token_id}&feed_secret={secret}"
+    download_url = _feed_download_url(post.guid, token_id, secret)
     
     # Check if processed
-    is_processed = post.processed_audio_path and Path(post.processed_audio_path).exists()
+    is_processed = _processed_exists(post.processed_audio_path)
     
     if is_processed:
-        response = flask.jsonify({
+        return _revalidated_json({
             "state": "ready",
             "processed": True,
             "download_url": download_url,
             "message": "Episode is ready to download",
             "job": None
         })
-        response.headers["Cache-Control"] = "no-store"
-        return response
     
     # Check for active job
-    job = ProcessingJob.query.filter(
-        ProcessingJob.post_guid == post.guid,
-        ProcessingJob.status.in_(["pending", "running"])
-    ).first()
+    job, last_failed_job = _trigger_job_state(post.guid)
     
     if job:
         # Use normalize_job for safe defaults on potentially NULL fields
         normalized = _normalize_job(job, download_url)
-        response = flask.jsonify(normalized)
-        response.headers["Cache-Control"] = "no-store"
-        return response
+        normalized["poll_after_ms"] = _trigger_poll_after_ms(
+            job, normalized["state"], normalized["job"]["progress_percentage"]
+        )
+        return _revalidated_json(normalized)
     
     # Check for failed job
-    last_job = ProcessingJob.query.filter(
-        ProcessingJob.post_guid == post.guid
-    ).order_by(ProcessingJob.created_at.desc()).first()
-    
-    if last_job and last_job.status == "failed":
+    if last_failed_job:
         # Use normalize_job for consistent response structure
-        normalized = _normalize_job(last_job, None)
+        normalized = _normalize_job(last_failed_job, None)
         # Format error for user-friendly display with technical details
-        formatted_error = _format_error_for_user(last_job.error_message)
+        formatted_error = _format_error_for_user(last_failed_job["error_message"])
         normalized["message"] = formatted_error["friendly"]
         normalized["error_details"] = {
             "friendly": formatted_error["friendly"],
             "technical": formatted_error["technical"],
             "retry_suggested": formatted_error["retry_suggested"],
         }
-        response = flask.jsonify(normalized)
-        response.headers["Cache-Control"] = "no-store"
-        return response
+        return _revalidated_json(normalized)
     
     # Not processed, no active job
-    response = flask.jsonify({
+    return _revalidated_json({
         "state": "not_started",
         "processed": False,
         "download_url": None,
         "message": "Episode has not been processed yet",
-        "job": None
+        "job": None,
+        "poll_after_ms": _TRIGGER_POLL_AFTER_MS["not_started"],
     })
-    response.headers["Cache-Control"] = "no-store"
-    return response
 
 
-def _render_trigger_error_page(
-    title: str,
-    message: str,
-    status_code: int = 400
-) -> flask.Response:
-    """Render a themed error page for trigger failures with proper HTTP status code."""
-    html = f'''<!DOCTYPE html>
+# Compiled once at import; autoescaping covers user-controlled titles/messages.
+_TRIGGER_TEMPLATE_ENV = jinja2.Environment(autoescape=True, auto_reload=False)
+
+_TRIGGER_ERROR_TEMPLATE = _TRIGGER_TEMPLATE_ENV.from_string('''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Podly Unicorn</title>
+    <title>{{ title }} - Podly Unicorn</title>
     <link rel="icon" type="image/svg+xml" href="/images/logos/favicon.svg">
     <link rel="icon" type="image/png" sizes="96x96" href="/images/logos/favicon-96x96.png">
     <link rel="icon" type="image/x-icon" href="/images/logos/favicon.ico">
     <link rel="apple-touch-icon" href="/images/logos/apple-touch-icon.png">
     <meta name="theme-color" content="#7c3aed">
     <style>
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
+        * { box-sizing: border-box; margin: 0; padding: 0; }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
@@ -1736,28 +2730,28 @@ def _render_trigger_error_page(
             align-items: center;
             justify-content: center;
             padding: 20px;
-        }}
-        .card {{
+        }
+        .card {
             background: white;
             border-radius: 16px;
             box-shadow: 0 20px 60px rgba(0,0,0,0.3);
             max-width: 480px;
             width: 100%;
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #9333ea 0%, #7c3aed 100%);
             color: white;
             padding: 24px;
             text-align: center;
-        }}
-        .header h1 {{ font-size: 1.5rem; margin-bottom: 4px; }}
-        .header .subtitle {{ opacity: 0.9; font-size: 0.9rem; }}
-        .content {{ padding: 24px; text-align: center; }}
-        .error-icon {{ font-size: 3rem; margin-bottom: 16px; color: #ef4444; }}
-        .error-title {{ font-size: 1.25rem; font-weight: 600; color: #1f2937; margin-bottom: 8px; }}
-        .error-message {{ color: #6b7280; margin-bottom: 24px; line-height: 1.5; }}
-        .btn {{
+        }
+        .header h1 { font-size: 1.5rem; margin-bottom: 4px; }
+        .header .subtitle { opacity: 0.9; font-size: 0.9rem; }
+        .content { padding: 24px; text-align: center; }
+        .error-icon { font-size: 3rem; margin-bottom: 16px; color: #ef4444; }
+        .error-title { font-size: 1.25rem; font-weight: 600; color: #1f2937; margin-bottom: 8px; }
+        .error-message { color: #6b7280; margin-bottom: 24px; line-height: 1.5; }
+        .btn {
             display: inline-block;
             padding: 12px 24px;
             border: none;
@@ -1768,11 +2762,11 @@ def _render_trigger_error_page(
             text-decoration: none;
             text-align: center;
             transition: transform 0.1s, box-shadow 0.1s;
-        }}
-        .btn:hover {{ transform: translateY(-1px); box-shadow: 0 4px 12px rgba(0,0,0,0.15); }}
-        .btn-primary {{ background: linear-gradient(135deg, #9333ea 0%, #7c3aed 100%); color: white; }}
-        .footer {{ text-align: center; padding: 16px 24px 24px; color: #9ca3af; font-size: 0.8rem; }}
-        .footer a {{ color: #7c3aed; text-decoration: none; }}
+        }
+        .btn:hover { transform: translateY(-1px); box-shadow: 0 4px 12px rgba(0,0,0,0.15); }
+        .btn-primary { background: linear-gradient(135deg, #9333ea 0%, #7c3aed 100%); color: white; }
+        .footer { text-align: center; padding: 16px 24px 24px; color: #9ca3af; font-size: 0.8rem; }
+        .footer a { color: #7c3aed; text-decoration: none; }
     </style>
 </head>
 <body>
@@ -1783,8 +2777,8 @@ def _render_trigger_error_page(
         </div>
         <div class="content">
             <div class="error-icon">&#9888;</div>
-            <div class="error-title">{title}</div>
-            <div class="error-message">{message}</div>
+            <div class="error-title">{{ title }}</div>
+            <div class="error-message">{{ message }}</div>
             <a href="/" class="btn btn-primary">Go to Podly</a>
         </div>
         <div class="footer">
@@ -1792,13 +2786,178 @@ def _render_trigger_error_page(
         </div>
     </div>
 </body>
-</html>'''
-    
-    response = flask.make_response(html, status_code)
-    response.headers["Content-Type"] = "text/html"
+</html>''')
+
+# The fallback page's stylesheet and polling scripts are served as separate
+# files under content-hashed names, so browsers cache them indefinitely and
+# only the small per-episode HTML is sent on each visit.
+_TRIGGER_ASSETS_DIR = Path(__file__).with_name("trigger_assets")
+_TRIGGER_ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+_TRIGGER_ASSETS: dict[str, tuple[bytes, bytes, str]] = {}
+
+
+def _publish_trigger_asset(
+    filename: str, mimetype: str, substitutions: Optional[dict[str, str]] = None
+) -> str:
+    """Register an asset under its content-hashed name and return its URL."""
+    body = (_TRIGGER_ASSETS_DIR / filename).read_bytes()
+    for placeholder, value in (substitutions or {}).items():
+        body = body.replace(placeholder.encode(), value.encode())
+    stem, ext = os.path.splitext(filename)
+    name = f"{stem}.{hashlib.blake2b(body).hexdigest()[:8]}{ext}"
+    _TRIGGER_ASSETS[name] = (body, gzip.compress(body, mtime=0), mimetype)
+    return f"/trigger/assets/{name}"
+
+
+_TRIGGER_CSS_URL = _publish_trigger_asset("trigger.css", "text/css")
+_TRIGGER_POLL_JS_URL = _publish_trigger_asset("trigger-poll.js", "text/javascript")
+# The worker imports the poll loop by URL; substituting it before hashing
+# gives the worker a new name whenever the loop changes.
+_TRIGGER_WORKER_JS_URL = _publish_trigger_asset(
+    "trigger-worker.js",
+    "text/javascript",
+    {"__TRIGGER_POLL_URL__": _TRIGGER_POLL_JS_URL},
+)
+_TRIGGER_JS_URL = _publish_trigger_asset("trigger.js", "text/javascript")
+# Lets the browser (or an Early Hints capable proxy) start fetching the assets
+# before the HTML has been parsed.
+_TRIGGER_CSS_PRELOAD = f"<{_TRIGGER_CSS_URL}>; rel=preload; as=style"
+_TRIGGER_JS_PRELOAD = (
+    f"<{_TRIGGER_POLL_JS_URL}>; rel=preload; as=script, "
+    f"<{_TRIGGER_JS_URL}>; rel=preload; as=script"
+)
+
+
+@post_bp.route("/trigger/assets/<name>", methods=["GET"])
+def trigger_asset(name: str) -> flask.Response:
+    """Serve a content-hashed fallback trigger page asset."""
+    asset = _TRIGGER_ASSETS.get(name)
+    if asset is None:
+        flask.abort(404)
+    body, gzipped, mimetype = asset
+    response = _precompressed_response(body, gzipped, mimetype=mimetype)
+    response.headers["Cache-Control"] = _TRIGGER_ASSET_CACHE_CONTROL
+    return response
+
+
+_TRIGGER_FALLBACK_TEMPLATE = _TRIGGER_TEMPLATE_ENV.from_string('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }} - Podly Unicorn</title>
+    <link rel="icon" type="image/svg+xml" href="/images/logos/favicon.svg">
+    <link rel="icon" type="image/png" sizes="96x96" href="/images/logos/favicon-96x96.png">
+    <link rel="icon" type="image/x-icon" href="/images/logos/favicon.ico">
+    <link rel="apple-touch-icon" href="/images/logos/apple-touch-icon.png">
+    <meta name="theme-color" content="#7c3aed">
+    <link rel="stylesheet" href="{{ css_url }}">
+</head>
+<body>
+    <div class="card">
+        <div class="header">
+            <h1>Podly Unicorn</h1>
+            <div class="subtitle">Ad-free podcast processing</div>
+        </div>
+        <div class="content">
+            {% if post %}<div class='episode-info'><div class='episode-title'>{{ post.title }}</div><div class='episode-show'>{{ feed_title }}</div></div>{% endif %}
+            <div id="status-container">
+                {% if state == "processing" %}
+                <div class="status-message" id="status-message">{{ message }}</div>
+                <div class='progress-container'><div class='progress-bar' id='progress-bar' style='width: {{ progress_percent }}%'></div></div>
+                <div class='step-name' id='step-name'>{{ step_name }}</div>
+                <div class='estimate'>Usually takes 1-2 minutes</div>
+                {% elif state == "ready" %}
+                <div class='success-icon'>&#10003;</div>
+                <div class="status-message" id="status-message">{{ message }}</div>
+                <a href='{{ download_url }}' class='btn btn-primary' id='download-btn'>Download Ad-Free Episode</a>
+                {% elif state == "error" %}
+                <div class='error-icon'>&#9888;</div>
+                <div class="status-message" id="status-message">{{ message }}</div>
+                {% else %}
+                <div class="status-message" id="status-message">{{ message }}</div>
+                {% endif %}
+            </div>
+        </div>
+        <div class="footer">
+            {% if state == "processing" %}This page starts ad removal for your episode.<br>Your download will be ready here when complete.{% else %}Return to your podcast app to listen.{% endif %}<br>
+            <a href="/">Podly Unicorn</a>
+        </div>
+    </div>
+    {% if state == "processing" and status_url %}<template id="ready-template">
+        <div class="success-icon">&#10003;</div>
+        <div class="status-message">Episode is ready to play!</div>
+        <a href="{{ download_url }}" class="btn btn-primary">Download Ad-Free Episode</a>
+    </template>
+    <template id="failed-template">
+        <div class="error-icon">&#9888;</div>
+        <div class="status-message"></div>
+    </template>
+    <script src="{{ poll_js_url }}" defer></script>
+    <script src="{{ js_url }}" data-status-url="{{ status_url }}" data-worker-url="{{ worker_js_url }}" defer></script>{% endif %}
+</body>
+</html>''')
+
+
+# Every caller passes fixed title/message strings, so each distinct error page
+# is rendered once and its bytes reused.
+@lru_cache(maxsize=64)
+def _trigger_error_html(title: str, message: str) -> tuple[bytes, bytes]:
+    """Rendered page bytes and their gzip encoding."""
+    html = _TRIGGER_ERROR_TEMPLATE.render(title=title, message=message).encode("utf-8")
+    return html, gzip.compress(html, mtime=0)
+
+
+def _precompressed_response(
+    body: bytes, gzipped: bytes, status: int = 200, mimetype: str = "text/html"
+) -> flask.Response:
+    """Serve `body`, or its precomputed gzip encoding when the client takes it.
+
+    The pages and their assets compress several-fold; encoding them once up
+    front keeps compression off the request path.
+    """
+    if has_request_context() and request.accept_encodings["gzip"]:
+        response = current_app.response_class(gzipped, status=status, mimetype=mimetype)
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = current_app.response_class(body, status=status, mimetype=mimetype)
+    response.vary.add("Accept-Encoding")
     return response
 
 
+def _render_trigger_error_page(
+    title: str,
+    message: str,
+    status_code: int = 400
+) -> flask.Response:
+    """Render a themed error page for trigger failures with proper HTTP status code."""
+    return _precompressed_response(*_trigger_error_html(title, message), status_code)
+
+
+# index.html only changes on deploy; keep its bytes keyed by path and mtime.
+_INDEX_HTML_CACHE: dict[str, tuple[int, bytes, bytes]] = {}
+
+
+def _cached_index_html(path: str) -> Optional[tuple[int, bytes, bytes]]:
+    """Return (mtime_ns, bytes, gzipped bytes) for the built index.html, or
+    None if missing."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    cached = _INDEX_HTML_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    cached = (mtime, data, gzip.compress(data, mtime=0))
+    _INDEX_HTML_CACHE[path] = cached
+    return cached
+
+
 def _render_trigger_page(
     title: str,
     message: str,
@@ -1818,13 +2977,17 @@ def _render_trigger_page(
     - Displaying the canonical ProcessingProgressUI component
     - Reactive state updates without page refresh
     """
-    import os
-    from flask import current_app, send_from_directory
-    
     static_folder = current_app.static_folder
-    if static_folder and os.path.exists(os.path.join(static_folder, "index.html")):
-        return send_from_directory(static_folder, "index.html")
-    
+    if static_folder:
+        index_html = _cached_index_html(os.path.join(static_folder, "index.html"))
+        if index_html is not None:
+            mtime, data, gzipped = index_html
+            response = _precompressed_response(data, gzipped)
+            # Each encoding is a different representation, so a different tag.
+            gz_suffix = "-gz" if response.content_encoding == "gzip" else ""
+            response.set_etag(f"{mtime:x}{gz_suffix}")
+            return cast(flask.Response, response.make_conditional(request))
+
     # Fallback to simple HTML if React app not built
     return _render_trigger_page_fallback(
         title, message, state, post, feed_title, 
@@ -1846,188 +3009,44 @@ def _render_trigger_page_fallback(
 ) -> flask.Response:
     """Fallback server-rendered trigger page when React app is not available."""
     
-    # Build status endpoint URL for polling
+    # Build status endpoint URL for polling. The template autoescapes every
+    # field it prints; the query values still need URL encoding of their own.
     status_url = ""
     if post and token_id and secret:
-        status_url = f"/api/trigger/status?guid={post.guid}&feed_token={token_id}&feed_secret={secret}"
+        status_url = "/api/trigger/status?" + urlencode(
+            {"guid": post.guid, "feed_token": token_id, "feed_secret": secret}
+        )
     
     # Progress info
     progress_percent = 0
     step_name = "Queued"
     if job:
-        progress_percent = int(job.progress_percentage or 0)
+        # Clamped integer: the width style only needs whole percents
+        progress_percent = max(0, min(100, int(job.progress_percentage or 0)))
         step_name = job.step_name or f"Step {job.current_step}/{job.total_steps}"
     
-    html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Podly Unicorn</title>
-    <link rel="icon" type="image/svg+xml" href="/images/logos/favicon.svg">
-    <link rel="icon" type="image/png" sizes="96x96" href="/images/logos/favicon-96x96.png">
-    <link rel="icon" type="image/x-icon" href="/images/logos/favicon.ico">
-    <link rel="apple-touch-icon" href="/images/logos/apple-touch-icon.png">
-    <meta name="theme-color" content="#7c3aed">
-    <style>
-        * {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            padding: 20px;
-        }}
-        .card {{
-            background: white;
-            border-radius: 16px;
-            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
-            max-width: 480px;
-            width: 100%;
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #9333ea 0%, #7c3aed 100%);
-            color: white;
-            padding: 24px;
-            text-align: center;
-        }}
-        .header h1 {{ font-size: 1.5rem; margin-bottom: 4px; }}
-        .header .subtitle {{ opacity: 0.9; font-size: 0.9rem; }}
-        .content {{ padding: 24px; }}
-        .episode-info {{
-            background: #f8f4ff;
-            border-radius: 12px;
-            padding: 16px;
-            margin-bottom: 20px;
-        }}
-        .episode-title {{ font-weight: 600; color: #1f2937; margin-bottom: 4px; font-size: 1.1rem; }}
-        .episode-show {{ color: #6b7280; font-size: 0.9rem; }}
-        .status-message {{ text-align: center; color: #4b5563; margin-bottom: 20px; font-size: 1rem; }}
-        .progress-container {{
-            background: #e5e7eb;
-            border-radius: 999px;
-            height: 12px;
-            overflow: hidden;
-            margin-bottom: 12px;
-        }}
-        .progress-bar {{
-            background: linear-gradient(90deg, #9333ea, #7c3aed);
-            height: 100%;
-            border-radius: 999px;
-            transition: width 0.5s ease;
-            width: {progress_percent}%;
-        }}
-        .progress-bar.indeterminate {{
-            width: 30%;
-            animation: indeterminate 1.5s infinite ease-in-out;
-        }}
-        @keyframes indeterminate {{
-            0% {{ transform: translateX(-100%); }}
-            100% {{ transform: translateX(400%); }}
-        }}
-        .step-name {{ text-align: center; color: #6b7280; font-size: 0.85rem; margin-bottom: 20px; }}
-        .estimate {{ text-align: center; color: #9ca3af; font-size: 0.8rem; margin-bottom: 20px; }}
-        .btn {{
-            display: block;
-            width: 100%;
-            padding: 14px 24px;
-            border: none;
-            border-radius: 10px;
-            font-size: 1rem;
-            font-weight: 600;
-            cursor: pointer;
-            text-decoration: none;
-            text-align: center;
-            transition: transform 0.1s, box-shadow 0.1s;
-        }}
-        .btn:hover {{ transform: translateY(-1px); box-shadow: 0 4px 12px rgba(0,0,0,0.15); }}
-        .btn-primary {{ background: linear-gradient(135deg, #9333ea 0%, #7c3aed 100%); color: white; }}
-        .footer {{ text-align: center; padding: 16px 24px 24px; color: #9ca3af; font-size: 0.8rem; }}
-        .footer a {{ color: #7c3aed; text-decoration: none; }}
-        .error-icon {{ font-size: 3rem; margin-bottom: 12px; text-align: center; }}
-        .success-icon {{ font-size: 3rem; margin-bottom: 12px; color: #10b981; text-align: center; }}
-    </style>
-</head>
-<body>
-    <div class="card">
-        <div class="header">
-            <h1>Podly Unicorn</h1>
-            <div class="subtitle">Ad-free podcast processing</div>
-        </div>
-        <div class="content">
-            {"<div class='episode-info'><div class='episode-title'>" + (post.title if post else "") + "</div><div class='episode-show'>" + feed_title + "</div></div>" if post else ""}
-            <div id="status-container">
-                {"<div class='success-icon'>&#10003;</div>" if state == "ready" else ""}
-                {"<div class='error-icon'>&#9888;</div>" if state == "error" else ""}
-                <div class="status-message" id="status-message">{message}</div>
-                {"<div class='progress-container'><div class='progress-bar " + ("indeterminate" if progress_percent == 0 else "") + "' id='progress-bar' style='width: " + str(progress_percent) + "%'></div></div>" if state == "processing" else ""}
-                {"<div class='step-name' id='step-name'>" + step_name + "</div>" if state == "processing" else ""}
-                {"<div class='estimate'>Usually takes 1-2 minutes</div>" if state == "processing" else ""}
-                {"<a href='" + download_url + "' class='btn btn-primary' id='download-btn'>Download Ad-Free Episode</a>" if state == "ready" else ""}
-            </div>
-        </div>
-        <div class="footer">
-            {"This page starts ad removal for your episode.<br>Your download will be ready here when complete." if state == "processing" else "Return to your podcast app to listen."}<br>
-            <a href="/">Podly Unicorn</a>
-        </div>
-    </div>
-    {"<script>" + _get_trigger_polling_script(status_url, download_url) + "</script>" if state == "processing" and status_url else ""}
-</body>
-</html>'''
-    
-    response = flask.make_response(html)
-    response.headers["Content-Type"] = "text/html"
+    # The template is compiled once at import (Jinja joins its constant and
+    # rendered pieces in one pass); encode the result once and hand Flask bytes.
+    body = _TRIGGER_FALLBACK_TEMPLATE.render(
+        title=title,
+        message=message,
+        state=state,
+        post=post,
+        feed_title=feed_title,
+        download_url=download_url,
+        status_url=status_url,
+        progress_percent=progress_percent,
+        step_name=step_name,
+        css_url=_TRIGGER_CSS_URL,
+        poll_js_url=_TRIGGER_POLL_JS_URL,
+        js_url=_TRIGGER_JS_URL,
+        worker_js_url=_TRIGGER_WORKER_JS_URL,
+    ).encode("utf-8")
+    
+    response = current_app.response_class(body, mimetype="text/html")
+    response.headers["Link"] = (
+        f"{_TRIGGER_CSS_PRELOAD}, {_TRIGGER_JS_PRELOAD}"
+        if state == "processing" and status_url
+        else _TRIGGER_CSS_PRELOAD
+    )
     return response
-
-
-def _get_trigger_polling_script(status_url: str, download_url: str) -> str:
-    """Generate JavaScript for polling the status endpoint."""
-    return f'''
-        const statusUrl = "{status_url}";
-        const downloadUrl = "{download_url}";
-        
-        async function checkStatus() {{
-            try {{
-                const response = await fetch(statusUrl + "&t=" + Date.now());
-                const data = await response.json();
-                
-                const statusMessage = document.getElementById('status-message');
-                const progressBar = document.getElementById('progress-bar');
-                const stepName = document.getElementById('step-name');
-                const statusContainer = document.getElementById('status-container');
-                
-                if (data.state === 'ready') {{
-                    statusContainer.innerHTML = `
-                        <div class="success-icon">&#10003;</div>
-                        <div class="status-message">Episode is ready to play!</div>
-                        <a href="${{downloadUrl}}" class="btn btn-primary">Download Ad-Free Episode</a>
-                    `;
-                    return;
-                }} else if (data.state === 'failed') {{
-                    statusContainer.innerHTML = `
-                        <div class="error-icon">&#9888;</div>
-                        <div class="status-message">${{data.message}}</div>
-                    `;
-                    return;
-                }} else if (data.state === 'processing' || data.state === 'queued') {{
-                    if (statusMessage) statusMessage.textContent = data.message;
-                    if (data.job && progressBar) {{
-                        const percent = data.job.progress_percentage || 0;
-                        progressBar.style.width = percent + '%';
-                        progressBar.classList.toggle('indeterminate', percent === 0);
-                    }}
-                    if (stepName && data.job) {{
-                        stepName.textContent = data.job.step_name || 'Processing...';
-                    }}
-                }}
-                setTimeout(checkStatus, 2000);
-            }} catch (error) {{
-                console.error('Status check failed:', error);
-                setTimeout(checkStatus, 5000);
-            }}
-        }}
-        setTimeout(checkStatus, 2000);
-    '''
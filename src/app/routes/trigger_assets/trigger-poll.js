@@ -0,0 +1,74 @@
+// Status poll loop shared by the fallback /trigger page and its SharedWorker.
+// Full-jitter exponential backoff on failures so open tabs don't retry in
+// lockstep after an outage; the server paces successes (see poll_after_ms).
+const BASE_RETRY_MS = 1000;
+const MAX_RETRY_MS = 30000;
+
+// Polls statusUrl until a terminal state or a 4xx other than 429, passing each successful
+// payload to onStatus. Nothing is fetched while isActive() is false: call
+// pause() when it turns false and resume() (which polls straight away to
+// catch up) when it turns true again.
+function pollStatus(statusUrl, onStatus, isActive) {
+    let attempt = 0;
+    let pending = null;
+    let inflight = null;
+    let done = false;
+
+    function schedule(ms) {
+        clearTimeout(pending);
+        pending = done || !isActive() ? null : setTimeout(check, ms);
+    }
+
+    async function check() {
+        pending = null;
+        const ctrl = new AbortController();
+        inflight = ctrl;
+        try {
+            const response = await fetch(statusUrl, {signal: ctrl.signal});
+            // Rate limited: wait as long as the server asks, then carry on
+            if (response.status === 429) {
+                const retryAfter = Number(response.headers.get('Retry-After'));
+                if (retryAfter > 0) {
+                    schedule(retryAfter * 1000 + Math.random() * 250);
+                    return;
+                }
+                throw new Error('HTTP 429');
+            }
+            const data = await response.json();
+            // 4xx is permanent (bad or revoked link); stop asking
+            if (response.status >= 400 && response.status < 500) {
+                done = true;
+                return;
+            }
+            if (!response.ok) throw new Error('HTTP ' + response.status);
+            attempt = 0;
+
+            onStatus(data);
+            if (data.state === 'ready' || data.state === 'failed') {
+                done = true;
+                return;
+            }
+            schedule(Math.max(500, data.poll_after_ms || 2000) + Math.random() * 250);
+        } catch (error) {
+            // Aborted by pause(); resume() picks up from here
+            if (error.name === 'AbortError') return;
+            console.error('Status check failed:', error);
+            attempt++;
+            schedule(Math.random() * Math.min(MAX_RETRY_MS, BASE_RETRY_MS * 2 ** attempt));
+        } finally {
+            if (inflight === ctrl) inflight = null;
+        }
+    }
+
+    schedule(2000);
+    return {
+        pause() {
+            clearTimeout(pending);
+            pending = null;
+            if (inflight) inflight.abort();
+        },
+        resume() {
+            if (!done && !inflight && pending === null && isActive()) check();
+        },
+    };
+}
@@ -0,0 +1,44 @@
+// One SharedWorker per status URL (the worker's name), so every open tab of
+// an episode shares a single poll loop instead of each running its own.
+importScripts('__TRIGGER_POLL_URL__');
+
+const ports = new Map();  // port -> whether its tab is visible
+let poller = null;
+let last = null;
+
+function anyVisible() {
+    for (const visible of ports.values()) {
+        if (visible) return true;
+    }
+    return false;
+}
+
+function broadcast(data) {
+    last = data;
+    for (const port of ports.keys()) port.postMessage(data);
+}
+
+self.onconnect = (event) => {
+    const port = event.ports[0];
+    port.onmessage = ({data: msg}) => {
+        if (msg.type === 'bye') {
+            ports.delete(port);
+        } else {
+            ports.set(port, msg.visible);
+        }
+        if (msg.type === 'hello') {
+            // Tabs that join late start from the latest status
+            if (last) port.postMessage(last);
+            if (!poller) {
+                poller = pollStatus(msg.statusUrl, broadcast, anyVisible);
+                return;
+            }
+        }
+        // Polls only while at least one tab is visible
+        if (anyVisible()) {
+            poller.resume();
+        } else {
+            poller.pause();
+        }
+    };
+};
@@ -0,0 +1,79 @@
+// Status updates for the fallback /trigger page. The page passes its poll and
+// worker URLs in data attributes so this file is identical for every episode;
+// the loop itself (pollStatus) comes from trigger-poll.js.
+const script = document.currentScript;
+const statusUrl = script.dataset.statusUrl;
+
+// Looked up once; each poll only touches what actually changed.
+const statusContainer = document.getElementById('status-container');
+const statusMessage = document.getElementById('status-message');
+const progressBar = document.getElementById('progress-bar');
+const stepName = document.getElementById('step-name');
+let lastMessage = statusMessage ? statusMessage.textContent : null;
+let lastPercent = null;
+let lastStep = stepName ? stepName.textContent : null;
+
+function setPercent(percent) {
+    progressBar.style.width = percent + '%';
+    progressBar.classList.toggle('indeterminate', percent === 0);
+    lastPercent = percent;
+}
+
+// The server renders only the width; the indeterminate class is ours alone
+if (progressBar) setPercent(parseInt(progressBar.style.width, 10) || 0);
+
+function showTemplate(id, message) {
+    const content = document.getElementById(id).content.cloneNode(true);
+    if (message !== undefined) {
+        content.querySelector('.status-message').textContent = message;
+    }
+    statusContainer.replaceChildren(content);
+}
+
+function render(data) {
+    if (data.state === 'ready') {
+        showTemplate('ready-template');
+    } else if (data.state === 'failed') {
+        showTemplate('failed-template', data.message);
+    } else if (data.state === 'processing' || data.state === 'queued') {
+        if (statusMessage && data.message !== lastMessage) {
+            statusMessage.textContent = lastMessage = data.message;
+        }
+        if (data.job && progressBar) {
+            const percent = data.job.progress_percentage || 0;
+            if (percent !== lastPercent) setPercent(percent);
+        }
+        if (stepName && data.job) {
+            const step = data.job.step_name || 'Processing...';
+            if (step !== lastStep) stepName.textContent = lastStep = step;
+        }
+    }
+}
+
+function onStatus(data) {
+    requestAnimationFrame(() => render(data));
+}
+
+if (typeof SharedWorker !== 'undefined') {
+    // All tabs showing this episode share one poll loop in a worker
+    const port = new SharedWorker(script.dataset.workerUrl, {name: statusUrl}).port;
+    const report = (type) => port.postMessage({type, statusUrl, visible: !document.hidden});
+    port.onmessage = ({data}) => onStatus(data);
+    report('hello');
+    document.addEventListener('visibilitychange', () => report('visibility'));
+    addEventListener('pagehide', () => report('bye'));
+    addEventListener('pageshow', (event) => {
+        if (event.persisted) report('hello');
+    });
+} else {
+    // Nothing is polled while the tab is hidden; showing it again polls
+    // straight away to catch up.
+    const poller = pollStatus(statusUrl, onStatus, () => !document.hidden);
+    document.addEventListener('visibilitychange', () => {
+        if (document.hidden) {
+            poller.pause();
+        } else {
+            poller.resume();
+        }
+    });
+}
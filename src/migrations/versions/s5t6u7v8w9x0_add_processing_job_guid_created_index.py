@@ -0,0 +1,38 @@
+"""Add composite (post_guid, created_at) index on processing_job
+
+Lets the trigger handler fetch a post's most recent job with a single index
+seek instead of scanning every job for the guid.
+
+Revision ID: s5t6u7v8w9x0
+Revises: r4s5t6u7v8w9
+Create Date: 2026-10-15
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "s5t6u7v8w9x0"
+down_revision = "r4s5t6u7v8w9"
+branch_labels = None
+depends_on = None
+
+_INDEX_NAME = "ix_processing_job_post_guid_created_at"
+
+
+def _index_exists(table_name, index_name):
+    inspector = sa.inspect(op.get_bind())
+    return index_name in [index["name"] for index in inspector.get_indexes(table_name)]
+
+
+def upgrade():
+    if _index_exists("processing_job", _INDEX_NAME):
+        return
+    op.create_index(
+        _INDEX_NAME, "processing_job", ["post_guid", "created_at"], unique=False
+    )
+
+
+def downgrade():
+    if not _index_exists("processing_job", _INDEX_NAME):
+        return
+    op.drop_index(_INDEX_NAME, table_name="processing_job")
@@ -235,7 +235,9 @@ class PodcastProcessor:
         if working_paths is None:
             raise ProcessorException("Processed audio path not found")
 
-        processed_audio_path = str(working_paths.post_processed_audio_path)
+        # Store the resolved path, like the recovered paths below, so serving
+        # the file never has to realpath() it again.
+        processed_audio_path = str(working_paths.post_processed_audio_path.resolve())
 
         # Use post GUID as lock key instead of file path for better granularity
         lock_key = post.guid
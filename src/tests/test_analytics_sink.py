@@ -0,0 +1,37 @@
+from app.analytics_sink import UserEventSink
+from app.extensions import db
+from app.models import Feed, Post, User, UserDownload
+
+
+def test_background_sink_flush_writes_rows_and_counts(app):
+    """flush() on a threaded sink commits queued rows and counters."""
+    feed = Feed(title="Test Feed", rss_url="https://example.com/feed.xml")
+    db.session.add(feed)
+    db.session.commit()
+
+    user = User(username="listener", role="user")
+    user.set_password("password123")
+    post = Post(
+        feed_id=feed.id,
+        guid="sink-guid",
+        download_url="https://example.com/audio.mp3",
+        title="Test Episode",
+    )
+    db.session.add_all([user, post])
+    db.session.commit()
+
+    sink = UserEventSink(app, synchronous=False, flush_interval_seconds=0.01)
+    for _ in range(3):
+        sink.count_download(post.id)
+        sink.put(
+            {
+                "user_id": user.id,
+                "post_id": post.id,
+                "event_type": "AUDIO_DOWNLOAD",
+            }
+        )
+    sink.flush()
+
+    db.session.expire_all()
+    assert db.session.get(Post, post.id).download_count == 3
+    assert UserDownload.query.filter_by(post_id=post.id).count() == 3
@@ -1,7 +1,17 @@
+from sqlalchemy import event
+
 from app.auth import AuthSettings
 from app.auth.middleware import SESSION_USER_KEY, init_auth_middleware
 from app.extensions import db
-from app.models import Feed, Post, User, UserFeedSubscription
+from app.models import (
+    Feed,
+    Identification,
+    ModelCall,
+    Post,
+    TranscriptSegment,
+    User,
+    UserFeedSubscription,
+)
 from app.routes.post_routes import post_bp
 
 
@@ -107,3 +117,411 @@ def test_download_endpoints_increment_counter(app, tmp_path):
         assert response.status_code == 200
         db.session.refresh(post)
         assert post.download_count == 2
+
+
+def test_original_download_honors_range_requests(app, tmp_path):
+    """Resuming clients should get 206 Partial Content for the original file."""
+    app.testing = True
+    app.config["SECRET_KEY"] = "test-secret"
+    app.config["AUTH_SETTINGS"] = AuthSettings(
+        require_auth=True,
+        admin_username="admin",
+        admin_password="password",
+    )
+    app.config["REQUIRE_AUTH"] = True
+    init_auth_middleware(app)
+    app.register_blueprint(post_bp)
+
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="https://example.com/feed.xml")
+        db.session.add(feed)
+        db.session.commit()
+
+        user = User(username="listener", role="user")
+        user.set_password("password123")
+        db.session.add(user)
+        db.session.commit()
+
+        original_audio = tmp_path / "original.mp3"
+        original_audio.write_bytes(b"0123456789")
+
+        post = Post(
+            feed_id=feed.id,
+            guid="range-guid",
+            download_url="https://example.com/audio.mp3",
+            title="Test Episode",
+            unprocessed_audio_path=str(original_audio),
+            whitelisted=True,
+        )
+        db.session.add(post)
+        db.session.commit()
+
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session[SESSION_USER_KEY] = user.id
+
+        response = client.get(
+            f"/api/posts/{post.guid}/download/original",
+            headers={"Range": "bytes=4-"},
+        )
+        assert response.status_code == 206
+        assert response.data == b"456789"
+        assert response.headers["Content-Range"] == "bytes 4-9/10"
+
+
+def test_feed_posts_cache_invalidated_on_whitelist_toggle(app):
+    """Cached feed listings must reflect whitelist changes made via the API."""
+    app.testing = True
+    app.register_blueprint(post_bp)
+
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="https://example.com/feed.xml")
+        db.session.add(feed)
+        db.session.commit()
+
+        post = Post(
+            feed_id=feed.id,
+            guid="cache-guid",
+            download_url="https://example.com/audio.mp3",
+            title="Test Episode",
+            whitelisted=False,
+        )
+        db.session.add(post)
+        db.session.commit()
+
+        client = app.test_client()
+
+        response = client.get(f"/api/feeds/{feed.id}/posts")
+        assert response.get_json()[0]["whitelisted"] is False
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        etag = response.headers["ETag"]
+
+        response = client.get(
+            f"/api/feeds/{feed.id}/posts", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304
+
+        response = client.post(
+            f"/api/posts/{post.guid}/whitelist", json={"whitelisted": True}
+        )
+        assert response.status_code == 200
+
+        response = client.get(
+            f"/api/feeds/{feed.id}/posts", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+        assert response.get_json()[0]["whitelisted"] is True
+
+
+def test_feed_posts_empty_feed_vs_missing_feed(app):
+    """An empty feed lists no posts; an unknown feed id is a 404."""
+    app.testing = True
+    app.register_blueprint(post_bp)
+
+    with app.app_context():
+        feed = Feed(title="Empty Feed", rss_url="https://example.com/empty.xml")
+        db.session.add(feed)
+        db.session.commit()
+
+        client = app.test_client()
+
+        response = client.get(f"/api/feeds/{feed.id}/posts")
+        assert response.status_code == 200
+        assert response.get_json() == []
+
+        response = client.get(f"/api/feeds/{feed.id + 1}/posts")
+        assert response.status_code == 404
+
+
+def test_processed_download_uses_x_accel_redirect(app, tmp_path, monkeypatch):
+    """With USE_X_ACCEL_REDIRECT the file transfer is delegated to nginx."""
+    monkeypatch.setenv("PODLY_PODCAST_DATA_DIR", str(tmp_path))
+    app.testing = True
+    app.config["SECRET_KEY"] = "test-secret"
+    app.config["AUTH_SETTINGS"] = AuthSettings(
+        require_auth=True,
+        admin_username="admin",
+        admin_password="password",
+    )
+    app.config["REQUIRE_AUTH"] = True
+    app.config["USE_X_ACCEL_REDIRECT"] = True
+    init_auth_middleware(app)
+    app.register_blueprint(post_bp)
+
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="https://example.com/feed.xml")
+        db.session.add(feed)
+        db.session.commit()
+
+        user = User(username="listener", role="user")
+        user.set_password("password123")
+        db.session.add(user)
+        db.session.commit()
+
+        db.session.add(UserFeedSubscription(user_id=user.id, feed_id=feed.id))
+        db.session.commit()
+
+        processed_audio = tmp_path / "srv" / "Test_Feed" / "episode one.mp3"
+        processed_audio.parent.mkdir(parents=True)
+        processed_audio.write_bytes(b"processed audio")
+
+        post = Post(
+            feed_id=feed.id,
+            guid="accel-guid",
+            download_url="https://example.com/audio.mp3",
+            title="Test Episode",
+            processed_audio_path=str(processed_audio),
+            whitelisted=True,
+        )
+        db.session.add(post)
+        db.session.commit()
+
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session[SESSION_USER_KEY] = user.id
+
+        response = client.get(f"/api/posts/{post.guid}/download")
+        assert response.status_code == 200
+        assert response.data == b""
+        assert (
+            response.headers["X-Accel-Redirect"]
+            == "/internal-audio/Test_Feed/episode%20one.mp3"
+        )
+        db.session.refresh(post)
+        assert post.download_count == 1
+
+        # Inline playback goes through nginx too, without the attachment header
+        response = client.get(f"/api/posts/{post.guid}/audio")
+        assert response.status_code == 200
+        assert (
+            response.headers["X-Accel-Redirect"]
+            == "/internal-audio/Test_Feed/episode%20one.mp3"
+        )
+        assert "Content-Disposition" not in response.headers
+
+        # A file missing on disk is never handed to nginx or counted
+        processed_audio.unlink()
+        response = client.get(f"/api/posts/{post.guid}/audio")
+        assert response.status_code == 404
+        assert response.get_json()["error_code"] == "AUDIO_NOT_READY"
+        response = client.get(f"/api/posts/{post.guid}/download")
+        assert "X-Accel-Redirect" not in response.headers
+        db.session.refresh(post)
+        assert post.download_count == 1
+
+
+def test_original_download_counts_only_served_files(app, tmp_path, monkeypatch):
+    """A missing original is a 404 and is not counted as a download."""
+    monkeypatch.setenv("PODLY_PODCAST_DATA_DIR", str(tmp_path))
+    app.testing = True
+    app.config["USE_X_ACCEL_REDIRECT"] = True
+    app.register_blueprint(post_bp)
+
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="https://example.com/feed.xml")
+        db.session.add(feed)
+        db.session.commit()
+
+        original_audio = tmp_path / "srv" / "Test_Feed" / "original.mp3"
+        original_audio.parent.mkdir(parents=True)
+        original_audio.write_bytes(b"original audio")
+
+        post = Post(
+            feed_id=feed.id,
+            guid="original-guid",
+            download_url="https://example.com/audio.mp3",
+            title="Test Episode",
+            unprocessed_audio_path=str(original_audio),
+            whitelisted=True,
+        )
+        db.session.add(post)
+        db.session.commit()
+
+        client = app.test_client()
+        response = client.get(f"/api/posts/{post.guid}/download/original")
+        assert response.status_code == 200
+        assert (
+            response.headers["X-Accel-Redirect"]
+            == "/internal-audio/Test_Feed/original.mp3"
+        )
+        assert (
+            response.headers["Cache-Control"] == "private, max-age=86400, immutable"
+        )
+
+        original_audio.unlink()
+        response = client.get(f"/api/posts/{post.guid}/download/original")
+        assert response.status_code == 404
+        assert "X-Accel-Redirect" not in response.headers
+
+        db.session.refresh(post)
+        assert post.download_count == 1
+
+
+def test_download_probe_for_unprocessed_post_returns_204(app):
+    """HEAD probes for unprocessed episodes short-circuit before auth."""
+    app.testing = True
+    app.register_blueprint(post_bp)
+
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="https://example.com/feed.xml")
+        db.session.add(feed)
+        db.session.commit()
+
+        post = Post(
+            feed_id=feed.id,
+            guid="probe-guid",
+            download_url="https://example.com/audio.mp3",
+            title="Test Episode",
+            whitelisted=True,
+        )
+        db.session.add(post)
+        db.session.commit()
+
+        client = app.test_client()
+        assert client.head(f"/api/posts/{post.guid}/download").status_code == 204
+        response = client.get(
+            f"/api/posts/{post.guid}/download", headers={"Range": "bytes=0-1"}
+        )
+        assert response.status_code == 204
+        assert client.head("/api/posts/missing/download").status_code == 404
+
+
+def test_processed_download_head_skips_body(app, tmp_path):
+    """HEAD on a processed episode answers from stat() with send_file's ETag."""
+    app.testing = True
+    app.config["SECRET_KEY"] = "test-secret"
+    app.config["AUTH_SETTINGS"] = AuthSettings(
+        require_auth=True,
+        admin_username="admin",
+        admin_password="password",
+    )
+    app.config["REQUIRE_AUTH"] = True
+    init_auth_middleware(app)
+    app.register_blueprint(post_bp)
+
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="https://example.com/feed.xml")
+        db.session.add(feed)
+        db.session.commit()
+
+        user = User(username="listener", role="user")
+        user.set_password("password123")
+        db.session.add(user)
+        db.session.commit()
+
+        db.session.add(UserFeedSubscription(user_id=user.id, feed_id=feed.id))
+        db.session.commit()
+
+        processed_audio = tmp_path / "processed.mp3"
+        processed_audio.write_bytes(b"processed audio")
+
+        post = Post(
+            feed_id=feed.id,
+            guid="head-guid",
+            download_url="https://example.com/audio.mp3",
+            title="Test Episode",
+            processed_audio_path=str(processed_audio),
+            whitelisted=True,
+        )
+        db.session.add(post)
+        db.session.commit()
+
+        client = app.test_client()
+        with client.session_transaction() as session:
+            session[SESSION_USER_KEY] = user.id
+
+        head = client.head(f"/api/posts/{post.guid}/download")
+        get = client.get(f"/api/posts/{post.guid}/download")
+        assert head.status_code == 200
+        assert head.headers["Content-Length"] == str(len(b"processed audio"))
+        assert head.headers["Accept-Ranges"] == "bytes"
+        assert head.headers["ETag"] == get.headers["ETag"]
+        db.session.refresh(post)
+        assert post.download_count == 1
+
+
+def test_classify_probe():
+    from app.routes.post_routes import _classify_probe
+
+    assert _classify_probe("HEAD", None)
+    assert _classify_probe("GET", "bytes=0-1")
+    assert _classify_probe("GET", "bytes=0-1023")
+    assert not _classify_probe("GET", None)
+    assert not _classify_probe("GET", "bytes=0-")
+    assert not _classify_probe("GET", "bytes=100-200")
+    assert not _classify_probe("GET", "bytes=0-1,5-9")
+    assert not _classify_probe("GET", "bytes=0-99999999")
+
+
+def test_post_stats_query_count_independent_of_identifications(app):
+    """api_post_stats issues the same statements however many rows it reports."""
+    app.testing = True
+    app.register_blueprint(post_bp)
+
+    with app.app_context():
+        feed = Feed(title="Test Feed", rss_url="https://example.com/feed.xml")
+        db.session.add(feed)
+        db.session.commit()
+        post = Post(
+            feed_id=feed.id,
+            guid="stats-guid",
+            download_url="https://example.com/audio.mp3",
+            title="Test Episode",
+        )
+        db.session.add(post)
+        db.session.commit()
+        call = ModelCall(
+            post_id=post.id,
+            first_segment_sequence_num=0,
+            last_segment_sequence_num=9,
+            model_name="gpt",
+            prompt="p",
+            status="success",
+        )
+        db.session.add(call)
+        db.session.commit()
+        post_id, call_id = post.id, call.id
+
+        def add_segments(start: int, count: int) -> None:
+            for n in range(start, start + count):
+                segment = TranscriptSegment(
+                    post_id=post_id,
+                    sequence_num=n,
+                    start_time=float(n),
+                    end_time=float(n + 1),
+                    text=f"segment {n}",
+                )
+                db.session.add(segment)
+                db.session.flush()
+                db.session.add(
+                    Identification(
+                        transcript_segment_id=segment.id,
+                        model_call_id=call_id,
+                        label="ad" if n % 2 else "content",
+                        confidence=0.9,
+                    )
+                )
+            db.session.commit()
+
+        statements: list[str] = []
+
+        def count(*args, **kwargs) -> None:  # pylint: disable=unused-argument
+            statements.append(args[2])
+
+        client = app.test_client()
+
+        def stats_query_count() -> int:
+            db.session.expunge_all()
+            statements.clear()
+            event.listen(db.engine, "before_cursor_execute", count)
+            try:
+                response = client.get("/api/posts/stats-guid/stats")
+            finally:
+                event.remove(db.engine, "before_cursor_execute", count)
+            assert response.status_code == 200
+            return len(statements)
+
+        add_segments(0, 2)
+        few = stats_query_count()
+        add_segments(2, 8)
+        assert stats_query_count() == few
@@ -300,3 +300,58 @@ def test_account_approval_email_uses_unicorn_subject(
     assert [message["subject"] for message in sent_messages] == [
         "Podly Unicorn: Account approved"
     ]
+
+
+def test_token_bucket_rate_limiter_throttles_after_capacity() -> None:
+    from app.auth.rate_limiter import TokenBucketRateLimiter
+
+    limiter = TokenBucketRateLimiter(capacity=2, refill_per_second=0.5)
+    assert limiter.acquire("token:client") is None
+    assert limiter.acquire("token:client") is None
+    assert limiter.acquire("token:client") == 2
+    # Buckets are independent per key.
+    assert limiter.acquire("token:other-client") is None
+
+
+def test_combined_token_rejected_on_trigger_paths_before_lookup(
+    auth_app: Flask, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import app.auth.middleware as middleware
+
+    def fail_lookup(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("combined token ids must not be looked up")
+
+    monkeypatch.setattr(middleware, "authenticate_feed_token", fail_lookup)
+    client = auth_app.test_client()
+
+    for path in ("/trigger", "/api/trigger/status"):
+        response = client.get(
+            f"{path}?guid=episode&feed_token=c_0123456789abcdef&feed_secret=x"
+        )
+        assert response.status_code == 403
+        assert response.get_json()["message"] == "Combined tokens not allowed"
+        assert response.headers["Cache-Control"] == "no-store"
+
+
+def test_trigger_page_rate_limit_renders_html(
+    auth_app: Flask, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import app.auth.middleware as middleware
+    from app.auth.rate_limiter import TokenBucketRateLimiter
+
+    monkeypatch.setitem(
+        middleware._TRIGGER_RATE_LIMITERS,
+        "/trigger",
+        TokenBucketRateLimiter(capacity=1, refill_per_second=1 / 60),
+    )
+    client = auth_app.test_client()
+    url = "/trigger?guid=episode&feed_token=c_0123456789abcdef&feed_secret=x"
+
+    assert client.get(url).status_code == 403
+    response = client.get(url)
+
+    assert response.status_code == 429
+    assert response.mimetype == "text/html"
+    assert b"Too Many Requests" in response.data
+    assert response.headers["Retry-After"] == "60"
+    assert response.headers["Cache-Control"] == "no-store"
@@ -8,8 +8,11 @@ These tests verify:
 4. Missing params return 400, never 500
 """
 
+import gzip
 import hashlib
+import re
 import secrets
+from datetime import datetime, timedelta
 
 import pytest
 from flask import Flask
@@ -19,7 +22,9 @@ from app.models import Feed, FeedAccessToken, Post, ProcessingJob, User
 from app.routes.main_routes import main_bp
 from app.routes.post_routes import (
     _render_trigger_error_page,
+    _render_trigger_page,
     _render_trigger_page_fallback,
+    _revalidated_json,
     post_bp,
 )
 
@@ -165,7 +170,7 @@ class TestTriggerStatusEndpoint:
     def test_valid_request_returns_json_with_cache_control(
         self, app_with_routes, test_post, test_token
     ):
-        """Valid request should return JSON with Cache-Control: no-store."""
+        """Valid request should return JSON the browser must revalidate."""
         client = app_with_routes.test_client()
 
         with app_with_routes.app_context():
@@ -180,8 +185,9 @@ class TestTriggerStatusEndpoint:
         assert response.status_code == 200
         assert response.content_type == "application/json"
 
-        # Must have Cache-Control: no-store
-        assert response.headers.get("Cache-Control") == "no-store"
+        # May be kept, but only after revalidating against the ETag
+        assert response.headers.get("Cache-Control") == "private, no-cache"
+        assert response.headers.get("ETag")
 
         # JSON should have required fields
         data = response.get_json()
@@ -196,6 +202,40 @@ class TestTriggerStatusEndpoint:
             "not_started",
         ]
 
+    def test_unchanged_status_returns_304(self, app_with_routes, test_post, test_token):
+        """A poll carrying the current ETag gets an empty 304."""
+        client = app_with_routes.test_client()
+
+        with app_with_routes.app_context():
+            post = db.session.merge(test_post)
+            url = (
+                f"/api/trigger/status?guid={post.guid}"
+                f"&feed_token={test_token['token_id']}"
+                f"&feed_secret={test_token['secret']}"
+            )
+            first = client.get(url)
+            second = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+        assert second.data == b""
+        assert second.headers.get("ETag") == first.headers["ETag"]
+
+    def test_prefixed_combined_token_rejected_without_lookup(
+        self, app_with_routes, test_post
+    ):
+        """Combined-token ids are refused from their prefix alone."""
+        client = app_with_routes.test_client()
+
+        response = client.get(
+            "/api/trigger/status?guid=test-guid-123"
+            "&feed_token=c_0123456789abcdef0123456789abcd&feed_secret=unused"
+        )
+
+        assert response.status_code == 403
+        assert response.headers.get("Cache-Control") == "no-store"
+        assert response.get_json()["state"] == "error"
+
     def test_nonexistent_post_returns_404(self, app_with_routes, test_token):
         """Unknown GUIDs currently fail token auth before post lookup."""
         client = app_with_routes.test_client()
@@ -211,6 +251,22 @@ class TestTriggerStatusEndpoint:
         assert data is not None
         assert data["state"] == "error"
 
+    def test_cached_auth_is_scoped_to_guid(
+        self, app_with_routes, test_post, test_token
+    ):
+        """A token accepted for one post is not reused for another guid."""
+        client = app_with_routes.test_client()
+        credentials = (
+            f"&feed_token={test_token['token_id']}"
+            f"&feed_secret={test_token['secret']}"
+        )
+
+        allowed = client.get(f"/api/trigger/status?guid=test-guid-123{credentials}")
+        other = client.get(f"/api/trigger/status?guid=nonexistent-guid{credentials}")
+
+        assert allowed.status_code == 200
+        assert other.status_code == 401
+
 
 class TestTriggerEndpoint:
     """Test /trigger endpoint."""
@@ -256,6 +312,48 @@ class TestTriggerEndpoint:
         assert b'<a href="/">Podly Unicorn</a>' in response.data
         assert b"<h1>Podly</h1>" not in response.data
 
+    def test_error_page_escapes_message(self, app_with_routes):
+        """Titles and messages are HTML-escaped by the precompiled template."""
+        with app_with_routes.app_context():
+            response = _render_trigger_error_page(
+                title="Not Found",
+                message="'<script>alert(1)</script>' is missing.",
+                status_code=404,
+            )
+
+        assert response.status_code == 404
+        assert b"<script>alert(1)</script>" not in response.data
+        assert b"&lt;script&gt;alert(1)&lt;/script&gt;" in response.data
+
+    def test_trigger_page_serves_cached_index_with_etag(
+        self, app_with_routes, tmp_path
+    ):
+        """The built index.html is served from memory and honours If-None-Match."""
+        (tmp_path / "index.html").write_text("<html>spa</html>")
+        app_with_routes.static_folder = str(tmp_path)
+
+        with app_with_routes.test_request_context("/trigger"):
+            first = _render_trigger_page("t", "m", "processing")
+        assert first.status_code == 200
+        assert first.get_data() == b"<html>spa</html>"
+        etag = first.headers["ETag"]
+
+        with app_with_routes.test_request_context(
+            "/trigger", headers={"If-None-Match": etag}
+        ):
+            second = _render_trigger_page("t", "m", "processing")
+        assert second.status_code == 304
+
+    def test_error_page_served_gzipped_when_accepted(self, app_with_routes):
+        """Clients advertising gzip get the precompressed error page."""
+        client = app_with_routes.test_client()
+        response = client.get("/trigger", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 400
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        assert b"Missing Parameters" in gzip.decompress(response.data)
+
     def test_fallback_page_uses_unicorn_product_identity(self, app_with_routes):
         """The no-React fallback should use the default Unicorn identity."""
         with app_with_routes.app_context():
@@ -271,6 +369,58 @@ class TestTriggerEndpoint:
         assert b'<a href="/">Podly Unicorn</a>' in response.data
         assert b"<h1>Podly</h1>" not in response.data
 
+    def test_fallback_page_escapes_fields_and_encodes_status_url(self, app_with_routes):
+        """Job fields are HTML-escaped and the poll URL's query is encoded."""
+        post = Post(guid="a&b<c>", title="Ep <1>")
+        job = ProcessingJob(
+            current_step=1,
+            total_steps=4,
+            step_name="<img src=x onerror=alert(1)>",
+            progress_percentage=10.0,
+        )
+        with app_with_routes.app_context():
+            response = _render_trigger_page_fallback(
+                title="Processing Started",
+                message="Episode queued.",
+                state="processing",
+                post=post,
+                token_id="tok",
+                secret="s&t",
+                job=job,
+            )
+
+        assert b"<img src=x" not in response.data
+        assert b"&lt;img src=x onerror=alert(1)&gt;" in response.data
+        assert b"Ep &lt;1&gt;" in response.data
+        assert (
+            b'data-status-url="/api/trigger/status?guid=a%26b%3Cc%3E'
+            b'&amp;feed_token=tok&amp;feed_secret=s%26t"'
+        ) in response.data
+
+    def test_fallback_page_assets_are_immutable(self, app_with_routes):
+        """The fallback page links hashed assets served with a long max-age."""
+        client = app_with_routes.test_client()
+
+        with app_with_routes.app_context():
+            page = _render_trigger_page_fallback(
+                title="Processing Started",
+                message="Episode queued.",
+                state="processing",
+            )
+
+        css_url = re.search(rb'href="(/trigger/assets/trigger\.\w{8}\.css)"', page.data)
+        assert css_url is not None
+        assert b"<style>" not in page.data
+        assert page.headers["Link"] == (
+            f"<{css_url.group(1).decode()}>; rel=preload; as=style"
+        )
+
+        response = client.get(css_url.group(1).decode())
+        assert response.status_code == 200
+        assert response.mimetype == "text/css"
+        assert "immutable" in response.headers["Cache-Control"]
+        assert client.get("/trigger/assets/trigger.css").status_code == 404
+
 
 class TestTriggerStatusProcessingState:
     """Test /api/trigger/status with processing jobs that have NULL fields.
@@ -500,6 +650,81 @@ class TestTriggerStatusWithActiveJob:
         assert "started_at" in data["job"]
         assert "updated_at" not in data["job"]
 
+    def test_bulk_deleted_job_is_not_served_from_cache(
+        self, app_with_routes, test_post, test_token
+    ):
+        """Query.delete() of a post's jobs drops its cached job state."""
+        client = app_with_routes.test_client()
+        url = (
+            "/api/trigger/status?guid=test-guid-123"
+            f"&feed_token={test_token['token_id']}"
+            f"&feed_secret={test_token['secret']}"
+        )
+
+        with app_with_routes.app_context():
+            db.session.add(
+                ProcessingJob(
+                    post_guid="test-guid-123",
+                    status="running",
+                    current_step=2,
+                    total_steps=4,
+                    step_name="Transcribing",
+                    progress_percentage=50.0,
+                )
+            )
+            db.session.commit()
+            assert client.get(url).get_json()["state"] == "processing"
+
+            ProcessingJob.query.filter_by(post_guid="test-guid-123").delete(
+                synchronize_session=False
+            )
+            db.session.commit()
+            assert client.get(url).get_json()["state"] == "not_started"
+
+    @pytest.mark.parametrize(("progress", "expected_ms"), [(50.0, 6000), (95.0, 500)])
+    def test_running_job_poll_after_follows_eta(
+        self, app_with_routes, test_post, test_token, progress, expected_ms
+    ):
+        """About ten polls across the remaining ETA, tight near the end."""
+        client = app_with_routes.test_client()
+
+        with app_with_routes.app_context():
+            post = db.session.merge(test_post)
+            job = ProcessingJob(
+                post_guid=post.guid,
+                status="running",
+                current_step=2,
+                total_steps=4,
+                step_name="Transcribing",
+                progress_percentage=progress,
+                started_at=datetime.utcnow() - timedelta(seconds=60),
+            )
+            db.session.add(job)
+            db.session.commit()
+
+            response = client.get(
+                f"/api/trigger/status?guid={post.guid}"
+                f"&feed_token={test_token['token_id']}"
+                f"&feed_secret={test_token['secret']}"
+            )
+
+        assert response.status_code == 200
+        assert response.get_json()["poll_after_ms"] == expected_ms
+
+    def test_poll_after_change_alone_keeps_etag(self, app_with_routes):
+        """A later hint for the same status still revalidates to a 304."""
+        payload = {"state": "processing", "job": {"progress": 50}}
+
+        with app_with_routes.test_request_context():
+            first = _revalidated_json({**payload, "poll_after_ms": 6000})
+        with app_with_routes.test_request_context(
+            headers={"If-None-Match": first.headers["ETag"]}
+        ):
+            second = _revalidated_json({**payload, "poll_after_ms": 6500})
+
+        assert first.status_code == 200
+        assert second.status_code == 304
+
     def test_completed_job_returns_200_ready(
         self, app_with_routes, test_post, test_token
     ):